@@ -0,0 +1,64 @@
+import os
+import sys
+import csv
+import time
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from qscript.common import write_rows_to_excel
+
+
+def _peak_rss_mb():
+    '''当前进程的峰值常驻内存（MB），无法获取时返回 None'''
+    try:
+        import resource
+    except ImportError:  # Windows
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return psutil.Process().memory_info().peak_wset / 1024 / 1024
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 单位为 KB，macOS 为字节
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def _generate_rows(count):
+    '''模拟 CSV 读取的结果：所有值都是字符串'''
+    for i in range(count):
+        yield [str(i), f"Job {i}", f"City {i % 500}", f"{i * 0.37:.2f}",
+               f"https://example.com/job/{i}"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="write_rows_to_excel 的性能测试：行/秒 与 峰值内存")
+    parser.add_argument("--rows", type=int, default=500000, help="写入的行数")
+    parser.add_argument("--csv", help="改为从指定 CSV 文件读取数据")
+    parser.add_argument("--output", help="输出文件，默认写入临时目录")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(tempfile.mkdtemp(), "bench.xlsx")
+    rss_before = _peak_rss_mb()
+    start = time.perf_counter()
+    if args.csv:
+        with open(args.csv, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            written = write_rows_to_excel(output, reader, headers=next(reader, None))
+    else:
+        written = write_rows_to_excel(output, _generate_rows(args.rows),
+                                      headers=["ID", "Job_name", "Location", "Score", "URL"])
+    elapsed = time.perf_counter() - start
+    rss_after = _peak_rss_mb()
+
+    print(f"写入行数: {written}")
+    print(f"用时: {elapsed:.2f} s")
+    print(f"速度: {written / elapsed:,.0f} 行/秒")
+    if rss_after is not None:
+        print(f"峰值内存: {rss_after:.1f} MB（开始前 {rss_before:.1f} MB）")
+    print(f"文件大小: {os.path.getsize(output) / 1024 / 1024:.1f} MB -> {output}")
+
+
+if __name__ == "__main__":
+    main()
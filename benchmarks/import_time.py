@@ -0,0 +1,86 @@
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# 需要检查的模块 -> 冷启动导入耗时上限（毫秒）
+BUDGETS_MS = {
+    "qscript": 5,
+    "qscript.common": 15,
+    "qscript.display": 20,
+    "qscript.folder_info": 10,
+    "qscript.tree_scan": 25,
+    "qscript.pe_check": 25,
+    "qscript.pdb_check": 25,
+    "qscript.lib_check": 25,
+    "qscript.crawler.web_crawler": 20,
+    "qscript.crawler.jobs": 30,
+}
+
+# 这些第三方库必须延迟到第一次使用时才导入
+HEAVY_MODULES = ("requests", "openpyxl", "PIL", "pefile", "pdbparse", "comtypes")
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(module):
+    '''
+    用 -X importtime 在新进程中导入模块。
+    返回 (该模块的累计导入耗时（微秒）, 导入过程中加载的所有模块名)。
+    '''
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"导入 {module} 失败:\n{proc.stderr}")
+    cumulative = None
+    imported = set()
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        imported.add(name)
+        if name == module:
+            cumulative = int(match.group(2))
+    return cumulative, imported
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="检查各模块的冷启动导入耗时，超出预算或导入了重型依赖时返回非零")
+    parser.add_argument("--repeat", type=int, default=5, help="每个模块测量的次数（取最小值）")
+    parser.add_argument("--scale", type=float, default=1.0, help="预算倍数，较慢的机器上可适当放宽")
+    args = parser.parse_args(argv)
+
+    failures = []
+    for module, budget in BUDGETS_MS.items():
+        timings = []
+        heavy = set()
+        for _ in range(args.repeat):
+            cumulative, imported = measure(module)
+            timings.append(cumulative)
+            heavy |= {name for name in imported if name.split(".")[0] in HEAVY_MODULES}
+        best_ms = min(timings) / 1000
+        limit = budget * args.scale
+        status = "OK"
+        if best_ms > limit:
+            status = "超时"
+            failures.append(f"{module}: {best_ms:.1f} ms > {limit:.1f} ms")
+        if heavy:
+            status = "重型依赖"
+            failures.append(f"{module}: 启动时导入了 {', '.join(sorted(heavy))}")
+        print(f"{module:<32} {best_ms:8.1f} ms  (预算 {limit:.0f} ms)  {status}")
+
+    if failures:
+        print("\n导入耗时回归:")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print("\n所有模块均在预算内。")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
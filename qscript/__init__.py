@@ -0,0 +1,49 @@
+'''
+常用脚本工具集。
+
+子模块和常用函数都在第一次访问时才导入，``import qscript`` 本身几乎没有开销；
+requests、openpyxl、PIL、pefile、pdbparse 等第三方库也只在真正用到的函数内部加载。
+'''
+
+import importlib
+
+__version__ = "1.0.0"
+
+# 属性名 -> 所在子模块
+_LAZY_ATTRS = {
+    'build_file_path': 'common',
+    'create_excel_file': 'common',
+    'create_new_worksheet': 'common',
+    'write_rows_to_excel': 'common',
+    'check_image_structure': 'common',
+    'verify_image': 'common',
+    'iter_image_integrity': 'common',
+    'check_image_integrity': 'common',
+    'ImageCheckCache': 'common',
+    'TimeTracer': 'display',
+    'RunningAnimation': 'display',
+    'FolderAnalysis': 'folder_info',
+    'scan_tree': 'tree_scan',
+    'register_analyzer': 'tree_scan',
+    'Analyzer': 'tree_scan',
+}
+
+_SUBMODULES = ('common', 'display', 'folder_info', 'tree_scan', 'pe_check', 'pdb_check',
+               'lib_check', 'typelib_check', 'crawler')
+
+__all__ = sorted(_LAZY_ATTRS) + list(_SUBMODULES)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(f'.{_LAZY_ATTRS[name]}', __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value  # 缓存，之后的访问不再经过 __getattr__
+    return value
+
+
+def __dir__():
+    return __all__
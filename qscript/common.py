@@ -0,0 +1,747 @@
+import os
+import re
+import sys
+import time
+import mmap
+import zlib
+import struct
+import sqlite3
+from itertools import chain, islice
+
+def build_file_path(*path_components):
+    """
+    构建文件路径，支持传入多个路径组件
+    
+    参数:
+    *path_components (str): 可变长度的路径组件参数
+    
+    返回:
+    str: 连接后的文件路径
+    """
+    return os.path.join(*path_components)
+
+# openpyxl、PIL 等第三方库只在函数内部导入，只用到 build_file_path 等函数时不需要加载它们
+
+def create_excel_file(file_name):
+    """
+    创建一个新的 Excel 文件。
+
+    参数:
+    file_name (str): 要创建的 Excel 文件的名称，需包含 .xlsx 扩展名。
+
+    返回:
+    bool: 如果文件创建成功返回 True，失败返回 False。
+    """
+    from openpyxl import Workbook
+
+    try:
+        # 创建一个新的工作簿
+        wb = Workbook()
+        # 保存工作簿到指定文件
+        wb.save(file_name)
+        return True
+    except Exception as e:
+        print(f"创建 Excel 文件时出错: {e}")
+        return False
+    
+def create_new_worksheet(workbook, sheet_name):
+    """
+    在指定的工作簿中创建一个新的工作表。
+
+    参数:
+    workbook (openpyxl.workbook.workbook.Workbook): 要操作的工作簿对象。
+    sheet_name (str): 新工作表的名称。
+
+    返回:
+    openpyxl.worksheet.worksheet.Worksheet: 新创建的工作表对象，如果创建失败则返回 None。
+    """
+    try:
+        # 在工作簿中创建一个新的工作表
+        new_sheet = workbook.create_sheet(title=sheet_name)
+        return new_sheet
+    except Exception as e:
+        print(f"创建工作表 {sheet_name} 时出错: {e}")
+        return None
+    
+
+EXCEL_MAX_ROWS = 1048576  # 单个工作表的最大行数
+
+
+# 只接受普通的十进制数字：int()/float() 还接受 '1_000'、'nan'、'inf'、全角数字等，
+# 这些在 CSV 中不是数字，NaN 和无穷大也无法写入 Excel
+_INT_RE = re.compile(r'[+-]?[0-9]+\Z')
+_FLOAT_RE = re.compile(r'[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?\Z')
+
+
+def _to_int(value):
+    if not _INT_RE.match(value):
+        raise ValueError(value)
+    # 前导零（编号、邮编）和超过 15 位的整数（Excel 会丢失精度）保留为文本
+    digits = value.lstrip('+-')
+    if (len(digits) > 1 and digits[0] == '0') or len(digits) > 15:
+        raise ValueError(value)
+    return int(value)
+
+
+def _to_float(value):
+    if not _FLOAT_RE.match(value):
+        raise ValueError(value)
+    # 与 _to_int 一致，带前导零的编号（如 007）不转换为 7.0
+    integer_part = value.lstrip('+-').split('.', 1)[0].split('e', 1)[0].split('E', 1)[0]
+    if len(integer_part) > 1 and integer_part[0] == '0':
+        raise ValueError(value)
+    result = float(value)
+    if result in (float('inf'), float('-inf')):  # 如 '1e999'
+        raise ValueError(value)
+    return result
+
+
+def _infer_column_types(sample, column_count):
+    """
+    根据样本推断每一列的类型，返回每列的转换函数（None 表示保持原样）。
+    只转换字符串（例如 CSV 读取的结果），已经是数字等类型的值保持不变。
+    """
+    converters = []
+    for col in range(column_count):
+        values = [row[col] for row in sample if col < len(row) and isinstance(row[col], str) and row[col] != '']
+        converter = None
+        for candidate in (_to_int, _to_float):
+            try:
+                for value in values:
+                    candidate(value)
+            except ValueError:
+                continue
+            converter = candidate if values else None
+            break
+        converters.append(converter)
+    return converters
+
+
+def _infer_column_widths(sample, headers, column_count, max_width):
+    """根据表头和样本估算每一列的宽度。"""
+    widths = [len(str(header)) for header in headers] if headers else [0] * column_count
+    widths += [0] * (column_count - len(widths))
+    for row in sample:
+        for col, value in enumerate(row[:column_count]):
+            if value is not None:
+                widths[col] = max(widths[col], len(str(value)))
+    return [min(max(width + 2, 8), max_width) for width in widths]
+
+
+def _convert_row(row, converters, illegal_characters_re):
+    """按列转换一行数据，转换失败或遇到非法字符时保留为清理后的字符串。"""
+    converted = []
+    for col, value in enumerate(row):
+        if isinstance(value, str):
+            converter = converters[col] if col < len(converters) else None
+            if converter is not None and value != '':
+                try:
+                    value = converter(value)
+                except ValueError:
+                    value = illegal_characters_re.sub('', value)
+            else:
+                value = illegal_characters_re.sub('', value)
+        converted.append(value)
+    return converted
+
+
+def write_rows_to_excel(file_name, rows, headers=None, sheet_name="Sheet", sample_size=1000, max_width=60):
+    """
+    以 openpyxl 的只写模式把任意行迭代器流式写入 Excel 文件，内存占用不随行数增长。
+    单个工作表写满 1,048,576 行后自动新建工作表继续写入。
+
+    参数:
+    file_name (str): 要保存的 Excel 文件名称，需包含 .xlsx 扩展名。
+    rows (iterable): 行迭代器，每行为序列（如 csv.reader 的结果）或字典（如职位、文件夹记录）。
+    headers (list): 表头，None 时若行为字典则使用第一行的键，否则不写表头。
+    sheet_name (str): 工作表名称，后续工作表依次命名为 sheet_name_2、sheet_name_3 ...
+    sample_size (int): 用于推断列类型和列宽的样本行数。
+    max_width (int): 列宽上限。
+
+    返回:
+    int: 写入的数据行数（不含表头）。
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+    from openpyxl.utils import get_column_letter
+
+    rows = iter(rows)
+    sample = list(islice(rows, sample_size))
+
+    # 字典行按表头顺序转换为列表
+    if sample and isinstance(sample[0], dict):
+        if headers is None:
+            headers = list(sample[0].keys())
+        keys = list(headers)
+
+        def to_list(row):
+            return [row.get(key) for key in keys]
+
+        sample = [to_list(row) for row in sample]
+        rows = map(to_list, rows)
+    else:
+        sample = [list(row) for row in sample]
+
+    column_count = max([len(headers) if headers else 0] + [len(row) for row in sample])
+    converters = _infer_column_types(sample, column_count)
+    widths = _infer_column_widths(sample, headers, column_count, max_width)
+    rows_per_sheet = EXCEL_MAX_ROWS - (1 if headers else 0)
+
+    wb = Workbook(write_only=True)
+
+    def new_sheet(index):
+        title = sheet_name if index == 1 else f"{sheet_name}_{index}"
+        ws = wb.create_sheet(title=title)
+        # 只写模式下列宽必须在写入第一行之前设置
+        for col, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+        if headers:
+            # 表头与数据一样要清理非法字符，否则 openpyxl 会抛出 IllegalCharacterError
+            ws.append([ILLEGAL_CHARACTERS_RE.sub('', header) if isinstance(header, str) else header
+                       for header in headers])
+        return ws
+
+    sheet_index = 1
+    ws = new_sheet(sheet_index)
+    sheet_rows = 0
+    total_rows = 0
+    for row in chain(sample, rows):
+        if sheet_rows >= rows_per_sheet:
+            sheet_index += 1
+            ws = new_sheet(sheet_index)
+            sheet_rows = 0
+        ws.append(_convert_row(row, converters, ILLEGAL_CHARACTERS_RE))
+        sheet_rows += 1
+        total_rows += 1
+
+    wb.save(file_name)
+    return total_rows
+
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp')
+
+# 检查级别：
+#   'fast' 只做结构检查，结构检查无法判断时才用 PIL 校验
+#   'full' 先做结构检查（快速排除截断文件），通过后再用 PIL 校验
+CHECK_LEVELS = ('fast', 'full')
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def _check_jpeg_structure(data):
+    """
+    JPEG：以 SOI(FFD8) 开头，按长度逐个跳过 SOS 之前的标记段，SOS 之后必须有 EOI(FFD9)。
+    EXIF 缩略图（位于 APP1 段中）自带的 EOI 会随标记段一起被跳过，不会把截断的照片误判为完整。
+    """
+    if data[:2] != b'\xff\xd8':
+        return False
+    size = len(data)
+    pos = 2
+    while True:
+        if pos + 4 > size or data[pos] != 0xFF:
+            return False  # SOS 之前文件就结束了，或标记段结构错误
+        marker = data[pos + 1]
+        if marker == 0xFF:  # 填充字节
+            pos += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:  # 没有长度字段的标记
+            pos += 2
+            continue
+        if marker == 0xD9:  # SOS 之前出现 EOI，没有图像数据，交给 PIL 判断
+            return None
+        length, = struct.unpack_from('>H', data, pos + 2)
+        if length < 2:
+            return False
+        pos += 2 + length
+        if marker == 0xDA:  # SOS：之后是熵编码数据
+            break
+    end = size
+    while end > pos and data[end - 1] == 0:  # 去掉末尾的补零
+        end -= 1
+    if data[end - 2:end] == b'\xff\xd9':
+        return True
+    # EOI 之后还有附加数据（部分相机会写入），交给 PIL 判断；SOS 之后找不到 EOI 则视为截断
+    return None if data.rfind(b'\xff\xd9', pos, end) != -1 else False
+
+
+def _check_png_structure(data):
+    """PNG：逐个校验数据块的长度与 CRC，直到 IEND。"""
+    if data[:8] != _PNG_SIGNATURE:
+        return False
+    pos = 8
+    size = len(data)
+    while pos + 12 <= size:
+        length, = struct.unpack_from('>I', data, pos)
+        end = pos + 12 + length
+        if end > size:
+            return False  # 数据块超出文件末尾：文件被截断
+        crc, = struct.unpack_from('>I', data, end - 4)
+        if zlib.crc32(data[pos + 4:end - 4]) != crc:
+            return False
+        if data[pos + 4:pos + 8] == b'IEND':
+            return True
+        pos = end
+    return False
+
+
+def _check_gif_structure(data):
+    """GIF：以 GIF87a/GIF89a 开头，并以 trailer(0x3B) 结尾。"""
+    if data[:6] not in (b'GIF87a', b'GIF89a'):
+        return False
+    end = len(data)
+    while end > 6 and data[end - 1] == 0:
+        end -= 1
+    return data[end - 1] == 0x3B
+
+
+def _check_bmp_structure(data):
+    """BMP：以 BM 开头，头部声明的文件大小不能超过实际大小。"""
+    if data[:2] != b'BM' or len(data) < 14:
+        return False
+    declared, = struct.unpack_from('<I', data, 2)
+    if declared > len(data):
+        return False
+    # 部分编码器把大小写成 0，无法判断
+    return True if declared else None
+
+
+_STRUCTURE_CHECKERS = {
+    '.jpg': _check_jpeg_structure,
+    '.jpeg': _check_jpeg_structure,
+    '.png': _check_png_structure,
+    '.gif': _check_gif_structure,
+    '.bmp': _check_bmp_structure,
+}
+
+
+def check_image_structure(file_path):
+    """
+    通过 mmap 读取文件并校验图片的结构标记，不解码图像数据。
+
+    参数:
+    file_path (str): 图片文件路径。
+
+    返回:
+    bool 或 None: True 表示结构完整，False 表示已损坏（如被截断），
+                  None 表示仅凭结构无法判断，需要用 PIL 进一步校验。
+    """
+    try:
+        return _check_structure(file_path)
+    except OSError:
+        return False
+
+
+def _check_structure(file_path):
+    """同 check_image_structure，但读取文件失败时抛出 OSError。"""
+    checker = _STRUCTURE_CHECKERS.get(os.path.splitext(file_path)[1].lower())
+    if checker is None:
+        return None
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return checker(data)
+        except ValueError:
+            return False
+
+
+def verify_image(file_path, level='full'):
+    """
+    检查单张图片是否损坏。
+
+    参数:
+    file_path (str): 图片文件路径。
+    level (str): 检查级别，见 iter_image_integrity。
+
+    返回:
+    bool: True 表示完好，False 表示损坏。
+    """
+    return _verify_image(file_path, level)[0]
+
+
+def _verify_image(file_path, level):
+    """
+    检查单张图片，返回 (是否完好, 是否可以缓存)。
+    读取文件时发生 OSError（权限、网络共享等临时故障）得到的结论不代表图片已损坏，不应写入缓存。
+    """
+    try:
+        result = _check_structure(file_path)
+    except OSError:
+        return False, False
+    if result is False:
+        return False, True
+    if result is True and level == 'fast':
+        return True, True
+    from io import BytesIO
+    from PIL import Image
+
+    try:
+        # 先把文件读入内存：PIL 对损坏的数据也会抛出 OSError，这样才能区分读取失败和图片损坏
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return False, False
+    try:
+        with Image.open(BytesIO(data)) as img:
+            img.verify()
+    except Exception:
+        return False, True
+    return True, True
+
+
+def _verify_image_batch(file_paths, level):
+    """在子进程中检查一批图片（减少进程间通信次数），返回 (路径, 是否完好, 是否可以缓存) 列表。"""
+    return [(file_path, *_verify_image(file_path, level)) for file_path in file_paths]
+
+
+
+def stale_paths(conn, table, folder_path, seen_paths):
+    """
+    找出 SQLite 表中位于 folder_path 下、但本次遍历没有出现的路径（文件已被删除）。
+
+    参数:
+    conn (sqlite3.Connection): 数据库连接。
+    table (str): 表名，表中需有 path 列（建有索引）。
+    folder_path (str): 本次遍历的文件夹（绝对路径）。
+    seen_paths (set): 本次遍历到的路径。
+
+    返回:
+    list: 需要删除的路径。
+    """
+    prefix = os.path.join(folder_path, '')
+    # 路径前缀范围查询：prefix <= path < prefix + U+10FFFF，可以使用 path 上的索引
+    rows = conn.execute(
+        f"SELECT path FROM {table} WHERE path >= ? AND path < ?", (prefix, prefix + '\U0010ffff')
+    ).fetchall()
+    return [path for path, in rows if path not in seen_paths]
+
+
+# 检查级别的强弱顺序，缓存中较强级别的结论可以直接用于较弱级别的检查
+_LEVEL_RANK = {'fast': 0, 'full': 1}
+
+
+class ImageCheckCache:
+    '''
+    图片检查结果的持久化缓存（SQLite）。
+
+    以 (路径, 大小, mtime_ns, inode) 标识文件，记录检查结论和所用的检查级别，
+    文件未变化时后续运行可直接跳过检查。
+    '''
+
+    def __init__(self, db_path, max_entries=2_000_000, commit_interval=1000, refresh_interval=24 * 3600):
+        self.db_path = db_path                   # 缓存数据库路径
+        self.max_entries = max_entries           # 最多保留的记录数，None 表示不限制
+        self.commit_interval = commit_interval   # 每写入多少条记录提交一次
+        self.refresh_interval = refresh_interval # 命中时距上次记录超过多少秒才刷新使用时间
+        self._uncommitted = 0                    # 尚未提交的写入数
+        self._preloaded = None                   # preload 读入的记录：路径 -> 记录
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS image_check ("
+            " path TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " inode INTEGER NOT NULL,"
+            " ok INTEGER NOT NULL,"
+            " level TEXT NOT NULL,"
+            " checked_at REAL NOT NULL)"  # 最近一次检查或缓存命中的时间
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS image_check_age ON image_check (checked_at)")
+        self.conn.commit()
+
+    def get(self, path, size, mtime_ns, inode, level):
+        '''查询缓存，返回 True/False 表示缓存的结论，None 表示未命中；命中时刷新记录的使用时间'''
+        if self._preloaded is not None and path.startswith(self._preloaded_prefix):
+            row = self._preloaded.get(path)
+        else:
+            row = self.conn.execute(
+                "SELECT size, mtime_ns, inode, ok, level, checked_at FROM image_check WHERE path = ?", (path,)
+            ).fetchone()
+        if row is None or row[:3] != (size, mtime_ns, inode):
+            return None
+        ok, cached_level = bool(row[3]), row[4]
+        # 损坏的结论在任何级别下都成立；完好的结论要求缓存的级别不低于本次级别
+        if not ok or _LEVEL_RANK.get(cached_level, -1) >= _LEVEL_RANK[level]:
+            # 仍然存在且未变化的文件最常被命中，刷新时间后不会被 evict 优先淘汰；
+            # 每次命中都写入会让热缓存的重新扫描慢数倍，所以超过 refresh_interval 才刷新
+            now = time.time()
+            if now - row[5] > self.refresh_interval:
+                self.conn.execute("UPDATE image_check SET checked_at = ? WHERE path = ?", (now, path))
+                self._count_write()
+            return ok
+        return None
+
+    def preload(self, folder_path):
+        '''
+        用一次路径前缀范围查询读入 folder_path 下的所有记录，之后对这些路径的 get 不再逐条查询数据库，
+        热缓存的重新扫描接近只遍历目录的耗时。prune 时释放。
+        '''
+        self._preloaded_prefix = os.path.join(folder_path, '')
+        self._preloaded = {
+            row[0]: row[1:] for row in self.conn.execute(
+                "SELECT path, size, mtime_ns, inode, ok, level, checked_at FROM image_check"
+                " WHERE path >= ? AND path < ?", (self._preloaded_prefix, self._preloaded_prefix + '\U0010ffff'))
+        }
+
+    def put(self, path, size, mtime_ns, inode, ok, level):
+        '''写入一条检查结果'''
+        self.conn.execute(
+            "INSERT OR REPLACE INTO image_check VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (path, size, mtime_ns, inode, int(ok), level, time.time()),
+        )
+        self._count_write()
+
+    def _count_write(self):
+        self._uncommitted += 1
+        if self._uncommitted >= self.commit_interval:
+            self.conn.commit()
+            self._uncommitted = 0
+
+    def prune(self, folder_path, seen_paths):
+        '''删除 folder_path 下本次遍历未出现的记录（文件已被删除），返回删除的数量'''
+        preloaded, self._preloaded = self._preloaded, None
+        if preloaded is not None and self._preloaded_prefix == os.path.join(folder_path, ''):
+            stale = [(path,) for path in preloaded if path not in seen_paths]  # 不必再次查询
+        else:
+            stale = [(path,) for path in stale_paths(self.conn, 'image_check', folder_path, seen_paths)]
+        self.conn.executemany("DELETE FROM image_check WHERE path = ?", stale)
+        self.conn.commit()
+        return len(stale)
+
+    def evict(self):
+        '''记录数超过 max_entries 时，淘汰最久没有检查或命中的记录'''
+        if self.max_entries is None:
+            return 0
+        count, = self.conn.execute("SELECT COUNT(*) FROM image_check").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self.conn.execute(
+                "DELETE FROM image_check WHERE path IN "
+                "(SELECT path FROM image_check ORDER BY checked_at LIMIT ?)", (excess,)
+            )
+        self.conn.commit()
+        return max(excess, 0)
+
+    def close(self):
+        '''提交写入、淘汰超额记录并关闭数据库'''
+        if self.conn is not None:
+            self.evict()
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def walk_files(folder_path, extensions=None, hidden=True):
+    """
+    用 os.scandir 流式遍历文件夹，逐个产出文件的 os.DirEntry。
+    不进入指向目录的符号链接，避免 up -> .. 之类的链接造成死循环。
+
+    参数:
+    folder_path (str): 要遍历的文件夹路径。
+    extensions (tuple): 只产出这些扩展名（小写，含 .）的文件，None 表示所有文件。
+    hidden (bool): 是否包含以 . 开头的隐藏文件和文件夹。
+
+    返回:
+    generator: os.DirEntry 对象，顺序与目录顺序不一定一致。
+    """
+    stack = [folder_path]
+    while stack:
+        current_dir = stack.pop()
+        try:
+            with os.scandir(current_dir) as it:
+                for entry in it:
+                    if not hidden and entry.name.startswith('.'):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file() and (extensions is None or entry.name.lower().endswith(extensions)):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+class BoundedSubmitter:
+    '''
+    限制同时提交到执行器（线程池或进程池）的任务数。
+    队列已满时 submit() 会等待至少一个任务完成，遍历速度不会超过处理速度太多，内存占用保持平稳。
+    '''
+
+    def __init__(self, executor, max_pending):
+        self.executor = executor
+        self.max_pending = max_pending
+        self.pending = set()
+
+    def submit(self, fn, *args):
+        '''提交一个任务，返回在等待期间已完成任务的结果列表（队列未满时为空列表）'''
+        from concurrent.futures import FIRST_COMPLETED, wait
+
+        self.pending.add(self.executor.submit(fn, *args))
+        if len(self.pending) < self.max_pending:
+            return []
+        done, self.pending = wait(self.pending, return_when=FIRST_COMPLETED)
+        return [future.result() for future in done]
+
+    def drain(self):
+        '''按完成顺序产出所有剩余任务的结果'''
+        from concurrent.futures import as_completed
+
+        pending, self.pending = self.pending, set()
+        for future in as_completed(pending):
+            yield future.result()
+
+
+def iter_image_integrity(folder_path, level='full', max_workers=None, batch_size=32, cache=None):
+    """
+    流式检查指定文件夹中的所有图片，边遍历边检查，逐个产出结果。
+
+    参数:
+    folder_path (str): 要检查的文件夹路径。
+    level (str): 检查级别，'fast' 仅在结构检查无法判断时才用 PIL 校验，
+                 'full' 结构检查通过后仍用 PIL 校验。
+    max_workers (int): 进程池大小，None 表示使用 CPU 核数，1 表示在当前进程中串行检查。
+    batch_size (int): 每个任务包含的图片数量。
+    cache (ImageCheckCache): 检查结果缓存，未变化的文件直接使用缓存结论；
+                             使用缓存时 folder_path 会转换为绝对路径。
+
+    返回:
+    generator: 逐个产出 (图片路径, 是否完好) 元组，顺序与遍历顺序不一定一致。
+    """
+    if level not in CHECK_LEVELS:
+        raise ValueError(f"未知的检查级别: {level}")
+    if not os.path.exists(folder_path):
+        return
+
+    if cache is not None:
+        folder_path = os.path.abspath(folder_path)
+        cache.preload(folder_path)
+    file_keys = {}      # 等待检查的文件 -> (大小, mtime_ns, inode)
+    seen_paths = set()  # 本次遍历到的所有图片，用于清理已删除文件的缓存
+
+    def iter_entries():
+        '''遍历图片，产出 (路径, 缓存结论)，缓存结论为 None 表示需要检查'''
+        for entry in walk_files(folder_path, IMAGE_EXTENSIONS):
+            if cache is None:
+                yield entry.path, None
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                yield entry.path, None
+                continue
+            key = (st.st_size, st.st_mtime_ns, entry.inode())
+            seen_paths.add(entry.path)
+            cached = cache.get(entry.path, *key, level)
+            if cached is None:
+                file_keys[entry.path] = key
+            yield entry.path, cached
+
+    def record(results):
+        '''把检查结果写入缓存（读取失败得到的结论不缓存），产出 (路径, 是否完好)'''
+        for file_path, ok, cacheable in results:
+            key = file_keys.pop(file_path, None)
+            if cache is not None and key is not None and cacheable:
+                cache.put(file_path, *key, ok, level)
+            yield file_path, ok
+
+    if max_workers == 1:
+        for file_path, cached in iter_entries():
+            if cached is not None:
+                yield file_path, cached
+            else:
+                yield from record([(file_path, *_verify_image(file_path, level))])
+    else:
+        from concurrent.futures import ProcessPoolExecutor  # 延迟导入，加快启动
+
+        max_workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            submitter = BoundedSubmitter(executor, 4 * max_workers)
+            batch = []
+            for file_path, cached in iter_entries():
+                if cached is not None:
+                    yield file_path, cached
+                    continue
+                batch.append(file_path)
+                if len(batch) < batch_size:
+                    continue
+                for results in submitter.submit(_verify_image_batch, batch, level):
+                    yield from record(results)
+                batch = []
+            if batch:
+                for results in submitter.submit(_verify_image_batch, batch, level):
+                    yield from record(results)
+            for results in submitter.drain():
+                yield from record(results)
+
+    # 完整遍历结束后，清理已删除文件的缓存记录
+    if cache is not None:
+        cache.prune(folder_path, seen_paths)
+
+
+def check_image_integrity(folder_path, level='full', max_workers=1, cache=None):
+    """
+    遍历指定文件夹中的所有图片，检查图片是否损坏。
+
+    参数:
+    folder_path (str): 要检查的文件夹路径。
+    level (str): 检查级别，见 iter_image_integrity。
+    max_workers (int): 进程池大小，默认 1 表示串行检查，None 表示使用 CPU 核数。
+    cache (str 或 ImageCheckCache): 检查结果缓存（数据库路径或缓存对象），None 表示不使用缓存。
+
+    返回:
+    tuple: 包含三个元素，
+           1. 该文件夹中图片的数量；
+           2. 损坏图片的数量；
+           3. 损坏图片的文件路径列表。
+    """
+    total_image_count = 0
+    corrupted_image_paths = []
+
+    owned_cache = ImageCheckCache(cache) if isinstance(cache, str) else None
+    try:
+        for file_path, ok in iter_image_integrity(folder_path, level=level, max_workers=max_workers,
+                                                  cache=owned_cache or cache):
+            total_image_count += 1
+            if not ok:
+                corrupted_image_paths.append(file_path)
+    finally:
+        if owned_cache is not None:
+            owned_cache.close()
+
+    return total_image_count, len(corrupted_image_paths), corrupted_image_paths
+
+
+def main(argv=None):
+    """命令行入口：检查文件夹中的图片是否损坏。"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="检查文件夹中的图片是否损坏")
+    parser.add_argument("folder", help="要检查的文件夹路径")
+    parser.add_argument("--level", choices=CHECK_LEVELS, default="full", help="检查级别")
+    parser.add_argument("--workers", type=int, default=None, help="进程数，1 表示串行检查")
+    parser.add_argument("--cache", help="检查结果缓存数据库路径")
+    args = parser.parse_args(argv)
+
+    total_images, corrupted_images, corrupted_paths = check_image_integrity(
+        args.folder, level=args.level, max_workers=args.workers, cache=args.cache)
+    print(f"该文件夹中图片的数量: {total_images}")
+    print(f"损坏图片的数量: {corrupted_images}")
+    for path in corrupted_paths:
+        print(path)
+    return 1 if corrupted_images else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+'''爬虫相关脚本：web_crawler 为通用的请求/分页工具，jobs 为职位列表爬虫。'''
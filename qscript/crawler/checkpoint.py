@@ -0,0 +1,94 @@
+import os
+import json
+
+
+def atomic_write_json(path, obj):
+    '''
+    原子地写入 JSON 文件：先写入同目录下的临时文件并落盘，再用 os.replace 替换目标文件。
+    进程在任何时刻崩溃，目标文件要么是旧内容，要么是完整的新内容。
+    '''
+    import tempfile  # 延迟导入，tempfile 会连带导入 random、shutil 等模块
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class CrawlCheckpoint:
+    '''
+    分页爬取的断点文件。
+
+    每提交一页数据后保存一次：已完成的偏移量（或游标）、去重状态、输出文件已写入的位置等。
+    --resume 时从断点继续，并把输出文件截断到断点记录的位置，避免重复写入。
+    '''
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        '''读取断点，不存在时返回 None'''
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def load_resume_state(self, output, resume):
+        '''
+        读取续爬状态。resume 为 False 时返回 None（重新开始）。
+        断点记录的输出文件与 output 不一致时抛出 ValueError；
+        要求续爬但没有断点、而输出文件已有内容时也抛出 ValueError，避免以 'w' 打开时清空已爬取的数据。
+        '''
+        if not resume:
+            return None
+        state = self.load()
+        if state is None:
+            if os.path.exists(output) and os.path.getsize(output) > 0:
+                raise ValueError(f"没有找到断点文件 {self.path}，无法续写已有内容的 {output}")
+            return None
+        if os.path.abspath(state["output"]) != os.path.abspath(output):
+            raise ValueError(f"断点对应的输出文件是 {state['output']}，而不是 {output}")
+        return state
+
+    def save(self, **state):
+        '''保存断点'''
+        atomic_write_json(self.path, state)
+
+    def clear(self):
+        '''删除断点'''
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def open_resumable_output(path, position=None, newline='', encoding='utf-8'):
+    '''
+    打开可断点续写的输出文件。
+
+    :param path: 输出文件路径
+    :param position: 断点记录的已提交位置（字节），None 表示从头写入新文件
+    :return: 以追加方式打开的文本文件；断点之后未提交的部分已被截断
+    '''
+    if position is None:
+        return open(path, 'w', newline=newline, encoding=encoding)
+    if os.path.getsize(path) < position:
+        raise ValueError(f"输出文件 {path} 比断点记录的位置短，无法续写")
+    os.truncate(path, position)
+    return open(path, 'a', newline=newline, encoding=encoding)
+
+
+def commit_output(f):
+    '''把输出文件刷新到磁盘，返回已提交的位置（字节）'''
+    f.flush()
+    os.fsync(f.fileno())
+    return f.tell()
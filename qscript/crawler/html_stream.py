@@ -0,0 +1,277 @@
+import re
+import time
+import codecs
+from html.parser import HTMLParser
+
+# 没有结束标签的元素，不入栈
+VOID_ELEMENTS = frozenset((
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr',
+))
+
+# 可以省略结束标签的元素：开始标签 -> (被它隐式关闭的元素, 查找时不越过的祖先元素)
+_P_SCOPE = frozenset(('button', 'table', 'td', 'th', 'caption', 'html', 'object', 'template'))
+_IMPLIED_END = {
+    'li': (frozenset(('li',)), frozenset(('ul', 'ol', 'menu'))),
+    'dt': (frozenset(('dt', 'dd')), frozenset(('dl',))),
+    'dd': (frozenset(('dt', 'dd')), frozenset(('dl',))),
+    'td': (frozenset(('td', 'th')), frozenset(('tr', 'table'))),
+    'th': (frozenset(('td', 'th')), frozenset(('tr', 'table'))),
+    'tr': (frozenset(('tr',)), frozenset(('table', 'thead', 'tbody', 'tfoot'))),
+    'option': (frozenset(('option',)), frozenset(('select', 'datalist', 'optgroup'))),
+}
+# 块级元素开始时关闭尚未结束的 <p>
+_IMPLIED_END.update((tag, (frozenset(('p',)), _P_SCOPE)) for tag in (
+    'p', 'div', 'ul', 'ol', 'dl', 'table', 'pre', 'blockquote', 'form', 'hr', 'section', 'article',
+    'aside', 'header', 'footer', 'nav', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+))
+
+_COMPOUND_TOKEN = re.compile(
+    r'(?P<tag>[a-zA-Z][\w-]*|\*)'
+    r'|#(?P<id>[\w-]+)'
+    r'|\.(?P<cls>[\w-]+)'
+    r'|\[\s*(?P<attr>[\w:-]+)\s*(?:=\s*(?:"(?P<dq>[^"]*)"|\'(?P<sq>[^\']*)\'|(?P<bare>[^\]\s]+))\s*)?\]'
+)
+_PSEUDO = re.compile(r'::(?:text|attr\(\s*([\w:-]+)\s*\))\s*$')
+
+
+class SelectorError(ValueError):
+    '''选择器语法错误'''
+
+
+class _Compound:
+    '''复合选择器，如 div.job#main[data-id=3]'''
+
+    __slots__ = ('tag', 'id', 'classes', 'attrs')
+
+    def __init__(self, text):
+        self.tag = None
+        self.id = None
+        self.classes = []
+        self.attrs = []  # (属性名, 值或 None)
+        pos = 0
+        while pos < len(text):
+            match = _COMPOUND_TOKEN.match(text, pos)
+            if match is None or (match.group('tag') and pos != 0):
+                raise SelectorError(f"无法解析选择器: {text!r}")
+            if match.group('tag'):
+                self.tag = None if match.group('tag') == '*' else match.group('tag').lower()
+            elif match.group('id'):
+                self.id = match.group('id')
+            elif match.group('cls'):
+                self.classes.append(match.group('cls'))
+            else:
+                value = next((v for v in match.group('dq', 'sq', 'bare') if v is not None), None)
+                self.attrs.append((match.group('attr').lower(), value))
+            pos = match.end()
+
+    def matches(self, element):
+        tag, attrs, classes = element
+        if self.tag is not None and tag != self.tag:
+            return False
+        if self.id is not None and attrs.get('id') != self.id:
+            return False
+        for cls in self.classes:
+            if cls not in classes:
+                return False
+        for name, value in self.attrs:
+            if name not in attrs or (value is not None and attrs[name] != value):
+                return False
+        return True
+
+
+class Selector:
+    '''
+    编译后的 CSS 选择器（子集）：标签、#id、.class、[attr]、[attr=value]，
+    后代（空格）与子元素（>）组合，末尾可加 ::text（默认）或 ::attr(name)。
+    匹配在解析过程中进行，只需要当前元素的祖先栈，不需要构建 DOM 树。
+    '''
+
+    def __init__(self, css):
+        self.css = css
+        self.attr = None  # 提取的属性名，None 表示提取文本
+        pseudo = _PSEUDO.search(css)
+        if pseudo:
+            self.attr = pseudo.group(1).lower() if pseudo.group(1) else None
+            css = css[:pseudo.start()]
+        # 从右到左保存：[(复合选择器, 与左侧的组合方式)]
+        parts = re.split(r'\s*(>)\s*|\s+', css.strip())
+        parts = [part for part in parts if part]
+        if not parts or parts[0] == '>' or parts[-1] == '>':
+            raise SelectorError(f"无法解析选择器: {self.css!r}")
+        self.steps = []
+        combinator = None
+        for part in reversed(parts):
+            if part == '>':
+                combinator = '>'
+                continue
+            if self.steps:
+                self.steps[-1] = (self.steps[-1][0], combinator or ' ')
+            self.steps.append((_Compound(part), None))
+            combinator = None
+
+    def matches(self, stack):
+        '''stack[-1] 为当前元素，其余为祖先'''
+        return self._match(stack, len(stack) - 1, 0)
+
+    def _match(self, stack, index, step):
+        compound, combinator = self.steps[step]
+        if not compound.matches(stack[index]):
+            return False
+        if step + 1 == len(self.steps):
+            return True
+        if combinator == '>':
+            return index > 0 and self._match(stack, index - 1, step + 1)
+        return any(self._match(stack, i, step + 1) for i in range(index - 1, -1, -1))
+
+
+def compile_selectors(fields):
+    '''把 {字段名: CSS 选择器} 编译为 {字段名: Selector}，已编译的 Selector 原样保留'''
+    return {name: sel if isinstance(sel, Selector) else Selector(sel) for name, sel in fields.items()}
+
+
+class _StopParsing(Exception):
+    '''所有字段都已找到，提前结束解析'''
+
+
+class _StreamExtractor(HTMLParser):
+
+    def __init__(self, selectors, multi):
+        super().__init__(convert_charrefs=True)
+        self.selectors = selectors
+        self.multi = multi                      # 需要提取所有匹配项的字段
+        self.results = {name: [] if name in multi else None for name in selectors}
+        self.pending = set(selectors)           # 尚未完成的字段
+        self.stack = []                         # 当前元素的祖先栈：(标签, 属性, 类名集合)
+        self.captures = []                      # 正在提取文本的字段：(字段名, 栈深度, 文本片段)
+        self.max_depth = 0
+
+    def _done(self, name, value):
+        if name in self.multi:
+            self.results[name].append(value)
+            return
+        self.results[name] = value
+        self.pending.discard(name)
+        if not self.pending:
+            raise _StopParsing
+
+    def _close_implied(self, tag):
+        '''同类元素开始时隐式关闭前一个（如 <li>a<li>b、<p>one<p>two）'''
+        closes, boundaries = _IMPLIED_END[tag]
+        for element in reversed(self.stack):
+            if element[0] in closes:
+                self.handle_endtag(element[0])
+                return
+            if element[0] in boundaries:
+                return
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _IMPLIED_END:
+            self._close_implied(tag)
+        attrs = {name: value or '' for name, value in attrs}
+        element = (tag, attrs, frozenset(attrs.get('class', '').split()))
+        self.stack.append(element)
+        try:
+            for name in list(self.pending):
+                selector = self.selectors[name]
+                if selector.matches(self.stack):
+                    if selector.attr is not None:
+                        if selector.attr in attrs:
+                            self._done(name, attrs[selector.attr])
+                    elif tag not in VOID_ELEMENTS and not any(c[0] == name for c in self.captures):
+                        self.captures.append((name, len(self.stack), []))
+        finally:
+            if tag in VOID_ELEMENTS:
+                self.stack.pop()
+        self.max_depth = max(self.max_depth, len(self.stack))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # 容错：结束标签与栈顶不一致时，弹出到对应的开始标签为止；找不到则忽略
+        for depth in range(len(self.stack), 0, -1):
+            if self.stack[depth - 1][0] == tag:
+                break
+        else:
+            return
+        finished = [capture for capture in self.captures if capture[1] >= depth]
+        self.captures = [capture for capture in self.captures if capture[1] < depth]
+        del self.stack[depth - 1:]
+        for name, _depth, parts in finished:
+            if name in self.pending:
+                self._done(name, ' '.join(''.join(parts).split()))
+
+    def handle_data(self, data):
+        for _name, _depth, parts in self.captures:
+            parts.append(data)
+
+
+def extract_html(chunks, fields, multi=()):
+    '''
+    增量解析 HTML 文本块并提取字段，不构建 DOM 树；所有单值字段都找到后立即停止读取。
+
+    :param chunks: 文本块的可迭代对象（如 iter_response_text(response)）
+    :param fields: {字段名: CSS 选择器或已编译的 Selector}
+    :param multi: 需要提取全部匹配项（返回列表）的字段名；包含这类字段时会解析完整个页面
+    :return: (提取结果字典, 统计信息字典)，统计信息包括解析用时、读取的字符数、是否提前结束、最大栈深度
+    '''
+    selectors = compile_selectors(fields)
+    parser = _StreamExtractor(selectors, frozenset(multi))
+    stats = {'parse_seconds': 0.0, 'chars': 0, 'stopped_early': False, 'max_depth': 0}
+    try:
+        for chunk in chunks:
+            stats['chars'] += len(chunk)
+            start = time.perf_counter()
+            try:
+                parser.feed(chunk)
+            finally:
+                stats['parse_seconds'] += time.perf_counter() - start
+        parser.close()
+        # 页面结束时仍未闭合的元素，已收集的文本也作为结果
+        for name, _depth, parts in parser.captures:
+            if name in parser.pending:
+                parser._done(name, ' '.join(''.join(parts).split()))
+    except _StopParsing:
+        stats['stopped_early'] = True
+    stats['max_depth'] = parser.max_depth
+    return parser.results, stats
+
+
+_META_CHARSET = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+
+def _response_encoding(response, head):
+    '''
+    确定响应的编码：优先使用 Content-Type 中的 charset，其次是页面开头 <meta> 声明的编码，默认 UTF-8。
+    （没有 charset 时 requests 对 text/html 给出的 ISO-8859-1 会把 UTF-8 页面解码成乱码。）
+    未知的编码名也按 UTF-8 处理。
+    '''
+    encoding = None
+    if 'charset' in response.headers.get('Content-Type', '').lower():
+        encoding = response.encoding
+    if not encoding:
+        match = _META_CHARSET.search(head)
+        encoding = match.group(1).decode('ascii') if match else 'utf-8'
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = 'utf-8'
+    return encoding
+
+
+def iter_response_text(response, chunk_size=16384):
+    '''按块读取 requests 流式响应（stream=True）并增量解码为文本'''
+    decoder = None
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder(_response_encoding(response, chunk))(errors='replace')
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    if decoder is not None:
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
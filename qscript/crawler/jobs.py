@@ -0,0 +1,170 @@
+import csv
+import argparse
+
+from ..display import TimeTracer
+from .checkpoint import CrawlCheckpoint, open_resumable_output, commit_output
+
+# 目标 API 的 URL
+api_url = "https://pultegroup.wd1.myworkdayjobs.com/wday/cxs/pultegroup/PGI/jobs"
+
+# 定义请求头，需将 Cookie 替换为你实际获取的值
+headers = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36 Edg/138.0.0.0",
+    "Referer": "https://pultegroup.wd1.myworkdayjobs.com/PGI",
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+    "Cookie": "PLAY_SESSION=69754d440e1ffdb99d6fa1ee6d28fbf646ad13ec-pultegroup_pSessionId=1j8sbv2jq1b8u4tu5t7v19fv9b&instance=vps-prod-q8l6shqa.prod-vps.pr502.cust.ash.wd; wd-browser-id=c66bb49e-6724-4bbe-a1cf-30ea98b27723; CALYPSO_CSRF_TOKEN=3818714c-b803-4acf-8c42-eb5cebf5f828; wday_vps_cookie=3027859466.53810.0000; __cflb=0H28vCu5mZQ5H5URQ4Xbzh7qZvE1AhPv4cCdydLaiLU; _cfuvid=lnSj2m60duwovxpmobgDD6xZr.a2s_lmvkjMslLBx3A-1753666594749-0.0.1.1-604800000; timezoneOffset=-480; __cf_bm=yNr6MxQxAYd9IJ.8fNL7m7uVR8t2terzF8zJuV63GUs-1753668866-1.0.1.1-wLD9k1E5Xj_z.i1wEfYt8Kijm6P_Zq6sQlrMuuPawu5Vqns4ii4wdxlax3fPZrW.Xa9zkHuM74cuv9hTymcGFVzD9dVlbmuljhPWqAIMqHs"  # 替换为实际的 Cookie
+}
+
+# 定义请求参数模板
+payload_template = {
+    "appliedFacets": {},
+    "limit": 20,
+    "offset": 0,
+    "searchText": ""
+}
+
+# 输出 CSV 的列
+FIELDNAMES = ["Job_name", "Location", "URL"]
+
+def get_job_listings(start_offset=0, seen=None, on_page=None):
+    '''
+    分页获取职位列表。
+    :param start_offset: 起始偏移量（断点续爬时使用）
+    :param seen: 已获取职位的去重键集合，会被原地更新
+    :param on_page: 每页处理完成后的回调 on_page(下一页偏移量, 本页新增职位, 是否已全部获取)
+    :return: 本次获取到的新职位列表
+    '''
+    import requests  # 延迟导入，加快命令行启动
+
+    all_jobs = []
+    offset = start_offset
+    seen = set() if seen is None else seen
+    finished = False  # 是否正常获取到最后一页（而不是因为出错中断）
+
+    while True:
+        # 复制参数模板并更新偏移量
+        payload = payload_template.copy()   
+        payload["offset"] = offset      # 分页参数，用于获取不同页的职位数据
+
+        try:
+            # 发送 POST 请求，将参数以 JSON 格式放在请求体中
+            response = requests.post(api_url, headers=headers, json=payload)
+            response.raise_for_status()
+            data = response.json()
+
+            # 打印响应数据，方便调试
+            print("Response Data:", data)
+
+            # 提取职位列表数据
+            job_postings = data.get("jobPostings", [])
+            if not job_postings:
+                finished = True
+                break
+
+            page_jobs = []
+            for job in job_postings:
+                job_name = job.get("title", "N/A")
+                location = job.get("locationsText", "N/A")
+                job_url = f"https://pultegroup.wd1.myworkdayjobs.com{job.get('externalPath', 'N/A')}"
+                new_job = {
+                    "Job_name": job_name,
+                    "Location": location,
+                    "URL": job_url
+                }
+                # 检查新职位是否已存在
+                key = job_key(new_job)
+                if key not in seen:
+                    seen.add(key)
+                    page_jobs.append(new_job)
+            all_jobs.extend(page_jobs)
+
+            # 更新偏移量，准备下一页请求
+            offset += payload["limit"]
+            print(f"当前偏移量: {offset}")  # 打印当前偏移量，方便调试
+
+        except requests.RequestException as e:
+            print(f"请求出错: {e}")
+            print("请求 URL:", api_url)
+            print("请求头:", headers)
+            print("请求体:", payload)
+            break
+        except ValueError:
+            print("无法解析 JSON 数据")
+            print("响应内容:", response.text)
+            break
+
+        if on_page is not None:
+            on_page(offset, page_jobs, False)
+
+    if finished and on_page is not None:
+        on_page(offset, [], True)
+    return all_jobs
+
+def job_key(job):
+    '''职位的去重键'''
+    return "\x1f".join(job[field] for field in FIELDNAMES)
+
+def crawl_jobs(filename, checkpoint_path=None, resume=False):
+    '''
+    爬取职位并逐页写入 CSV，每提交一页保存一次断点。
+    崩溃后以 resume=True 重新运行，会从最后提交的页继续，输出文件中不会出现重复行。
+    :return: 本次新写入的行数
+    '''
+    checkpoint = CrawlCheckpoint(checkpoint_path or filename + ".checkpoint.json")
+    state = checkpoint.load_resume_state(filename, resume)
+    if state is not None and state.get("done"):
+        print(f"断点显示爬取已完成（共 {state['rows']} 条），无需续爬。")
+        return 0
+
+    if state is None:
+        offset, seen, rows, position = 0, set(), 0, None
+    else:
+        offset, seen, rows, position = state["offset"], set(state["seen"]), state["rows"], state["output_pos"]
+        print(f"从断点继续: 偏移量 {offset}，已保存 {rows} 条")
+
+    written = 0
+    with open_resumable_output(filename, position) as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+        if position is None:
+            writer.writeheader()
+
+        def on_page(next_offset, page_jobs, finished):
+            nonlocal rows, written
+            writer.writerows(page_jobs)
+            rows += len(page_jobs)
+            written += len(page_jobs)
+            # 先把数据写入磁盘，再保存断点：断点中的位置之前的数据一定已经提交
+            checkpoint.save(offset=next_offset, seen=sorted(seen), rows=rows,
+                            output=filename, output_pos=commit_output(csvfile), done=finished)
+
+        get_job_listings(start_offset=offset, seen=seen, on_page=on_page)
+
+    print(f"本次新增 {written} 条，共 {rows} 条数据已保存到 {filename}")
+    return written
+
+def save_to_csv(data, filename):
+    if data:
+        keys = data[0].keys()
+        with open(filename, "w", newline="", encoding="utf-8") as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=keys)
+            writer.writeheader()
+            writer.writerows(data)
+        print(f"共 {len(data)} 条数据已保存到 {filename}")
+    else:
+        print("没有数据可保存。")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="职位列表爬虫")
+    parser.add_argument("--output", "-o", default="job_data.csv", help="输出 CSV 文件")
+    parser.add_argument("--checkpoint", help="断点文件，默认为 <输出文件>.checkpoint.json")
+    parser.add_argument("--resume", action="store_true", help="从上次中断的位置继续")
+    args = parser.parse_args(argv)
+
+    crawl_jobs(args.output, checkpoint_path=args.checkpoint, resume=args.resume)
+
+if __name__ == "__main__":
+    with TimeTracer() as time_tracer:
+        print("开始爬取数据...")
+        main()
+        print("数据爬取完成。")
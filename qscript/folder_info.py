@@ -0,0 +1,542 @@
+import os
+import re
+import sys
+import struct
+from collections import defaultdict, deque
+import math
+
+def _get_folder_name(folder_path):
+        # 规范化路径（自动处理末尾分隔符和跨平台格式）
+        normalized_path = os.path.normpath(folder_path)
+        # 直接获取最后一段名称
+        return os.path.basename(normalized_path)
+
+# 内容识别时每个文件最多读取的字节数（tar 的 ustar 标记位于第 257 字节）
+SNIFF_SIZE = 264
+
+# 魔数签名表：(类型, 偏移, 签名)。按顺序匹配，较具体的签名放在前面
+MAGIC_SIGNATURES = [
+    ('png', 0, b'\x89PNG\r\n\x1a\n'),
+    ('jpeg', 0, b'\xff\xd8\xff'),
+    ('gif', 0, b'GIF87a'),
+    ('gif', 0, b'GIF89a'),
+    ('webp', 0, b'RIFF....WEBP'),
+    ('wav', 0, b'RIFF....WAVE'),
+    ('avi', 0, b'RIFF....AVI '),
+    ('tiff', 0, b'II*\x00'),
+    ('tiff', 0, b'MM\x00*'),
+    ('ico', 0, b'\x00\x00\x01\x00'),
+    ('psd', 0, b'8BPS'),
+    ('pdf', 0, b'%PDF-'),
+    ('zip', 0, b'PK\x03\x04'),
+    ('zip', 0, b'PK\x05\x06'),
+    ('gzip', 0, b'\x1f\x8b'),
+    ('bzip2', 0, b'BZh'),
+    ('xz', 0, b'\xfd7zXZ\x00'),
+    ('7z', 0, b"7z\xbc\xaf'\x1c"),
+    ('rar', 0, b'Rar!\x1a\x07'),
+    ('tar', 257, b'ustar'),
+    ('ole2', 0, b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'),
+    ('sqlite', 0, b'SQLite format 3\x00'),
+    ('pdb', 0, b'Microsoft C/C++ MSF 7.00'),
+    ('lib', 0, b'!<arch>\n'),
+    ('pe', 0, b'MZ'),
+    ('elf', 0, b'\x7fELF'),
+    ('macho', 0, b'\xcf\xfa\xed\xfe'),
+    ('macho', 0, b'\xce\xfa\xed\xfe'),
+    ('class', 0, b'\xca\xfe\xba\xbe'),
+    ('mp3', 0, b'ID3'),
+    ('flac', 0, b'fLaC'),
+    ('ogg', 0, b'OggS'),
+    ('mp4', 4, b'ftyp'),
+    ('mkv', 0, b'\x1aE\xdf\xa3'),
+    ('woff', 0, b'wOFF'),
+    ('woff2', 0, b'wOF2'),
+    ('otf', 0, b'OTTO'),
+    ('bmp', 0, b'BM'),
+]
+
+# 各类型对应的常见扩展名，用于检查扩展名与内容是否一致
+TYPE_EXTENSIONS = {
+    'png': {'.png'},
+    'jpeg': {'.jpg', '.jpeg', '.jpe', '.jfif'},
+    'gif': {'.gif'},
+    'webp': {'.webp'},
+    'wav': {'.wav'},
+    'avi': {'.avi'},
+    'tiff': {'.tif', '.tiff', '.dng', '.nef', '.cr2', '.arw'},
+    'ico': {'.ico', '.cur'},
+    'psd': {'.psd', '.psb'},
+    'pdf': {'.pdf', '.ai'},
+    'zip': {'.zip', '.docx', '.xlsx', '.pptx', '.odt', '.ods', '.odp', '.jar', '.whl', '.apk',
+            '.epub', '.nupkg', '.xpi', '.egg', '.vsix', '.3mf'},
+    'gzip': {'.gz', '.tgz', '.svgz'},
+    'bzip2': {'.bz2', '.tbz2', '.tbz'},
+    'xz': {'.xz', '.txz'},
+    '7z': {'.7z'},
+    'rar': {'.rar'},
+    'tar': {'.tar'},
+    'ole2': {'.doc', '.xls', '.ppt', '.msi', '.msg', '.vsd', '.db'},
+    'sqlite': {'.sqlite', '.sqlite3', '.db', '.db3'},
+    'pdb': {'.pdb'},
+    'lib': {'.lib', '.a'},
+    'pe': {'.exe', '.dll', '.pyd', '.sys', '.ocx', '.efi', '.scr', '.cpl', '.drv', '.mui', '.node'},
+    'elf': {'.so', '.o', '.elf', '.bin', '.node'},
+    'macho': {'.dylib', '.so', '.bundle', '.o'},
+    'class': {'.class'},
+    'mp3': {'.mp3'},
+    'flac': {'.flac'},
+    'ogg': {'.ogg', '.oga', '.ogv', '.opus'},
+    'mp4': {'.mp4', '.m4a', '.m4v', '.mov', '.3gp', '.heic', '.heif', '.avif'},
+    'mkv': {'.mkv', '.webm'},
+    'woff': {'.woff'},
+    'woff2': {'.woff2'},
+    'otf': {'.otf'},
+    'bmp': {'.bmp', '.dib'},
+    'xml': {'.xml', '.svg', '.xsd', '.xsl', '.xslt', '.plist', '.config', '.csproj', '.vcxproj', '.props',
+            '.resx', '.xaml', '.manifest', '.html', '.htm', '.xhtml', '.rss', '.atom', '.kml', '.gpx'},
+    'html': {'.html', '.htm', '.xhtml', '.shtml', '.php', '.asp', '.aspx', '.jsp', '.vue'},
+}
+
+# 已知二进制格式的扩展名
+_BINARY_EXTENSIONS = frozenset(
+    extension for kind, extensions in TYPE_EXTENSIONS.items() if kind not in ('xml', 'html')
+    for extension in extensions
+)
+
+# 所有签名编译成一个正则，一次 match 即可得到类型；签名中的 . 表示任意字节
+_MAGIC_RE = re.compile(b'|'.join(
+    b'(?P<m%d>%s%s)' % (index, b'.' * offset, b'.'.join(re.escape(part) for part in signature.split(b'.')))
+    for index, (_kind, offset, signature) in enumerate(MAGIC_SIGNATURES)
+), re.DOTALL)
+
+
+def _is_text(header):
+    '''文件头是否像纯文本：没有 0 字节且能按 UTF-8 解码'''
+    if b'\x00' in header:
+        return False
+    try:
+        header.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # 截断位置恰好落在多字节字符中间时仍视为文本
+        if e.start < len(header) - 3:
+            return False
+    return True
+
+
+# BITMAPINFOHEADER 及其各版本的大小
+_BMP_DIB_SIZES = frozenset((12, 16, 40, 52, 56, 64, 108, 124))
+
+
+def _valid_bmp(header):
+    # 保留字段为 0，偏移 14 处是 DIB 头大小
+    return (len(header) >= 18 and header[6:10] == b'\x00\x00\x00\x00'
+            and struct.unpack_from('<I', header, 14)[0] in _BMP_DIB_SIZES)
+
+
+def _valid_pe(header):
+    if len(header) < 64:
+        return False
+    e_lfanew, = struct.unpack_from('<I', header, 0x3C)
+    if e_lfanew + 4 <= len(header):
+        return header[e_lfanew:e_lfanew + 4] == b'PE\x00\x00'
+    # PE 头在读取范围之外（DOS stub 较长）：DOS 头中必然有 0 字节，纯文本没有
+    return b'\x00' in header[:64]
+
+
+def _valid_id3(header):
+    # 主版本号 2~4，大小字段每个字节的最高位为 0
+    return len(header) >= 10 and header[3] in (2, 3, 4) and all(b < 0x80 for b in header[6:10])
+
+
+def _valid_bzip2(header):
+    # 块大小 1~9，随后是数据块或流结束标记
+    return len(header) >= 10 and 0x31 <= header[3] <= 0x39 and header[4:10] in (b'1AY&SY', b'\x17rE8P\x90')
+
+
+def _not_text(header):
+    return not _is_text(header)
+
+
+# 较弱的签名（很短且全是可打印字符）需要进一步校验，避免把 "BMW,..." 之类的文本识别为图片。
+# 没有专门校验的（fLaC、OggS、OTTO 等）：真实文件头中都有 0 字节，能解码为文本时不采用
+_SIGNATURE_CHECKS = {kind: _not_text for kind, _offset, signature in MAGIC_SIGNATURES
+                     if len(signature) <= 4 and all(32 <= b < 127 for b in signature)}
+_SIGNATURE_CHECKS.update({'bmp': _valid_bmp, 'pe': _valid_pe, 'mp3': _valid_id3, 'bzip2': _valid_bzip2})
+
+
+def detect_content_type(header):
+    """
+    根据文件开头的字节识别内容类型。
+    :param header: 文件开头最多 SNIFF_SIZE 个字节
+    :return: 类型名，如 'png'、'zip'、'pe'；无法识别时返回 'text'、'xml'、'html'、'binary' 或 'empty'
+    """
+    if not header:
+        return 'empty'
+    match = _MAGIC_RE.match(header)
+    if match:
+        kind = MAGIC_SIGNATURES[int(match.lastgroup[1:])][0]
+        check = _SIGNATURE_CHECKS.get(kind)
+        if check is None or check(header):
+            return kind
+    if not _is_text(header):
+        return 'binary'
+    head = header.lstrip(b'\xef\xbb\xbf \t\r\n').lower()
+    if head.startswith(b'<?xml') or head.startswith(b'<svg'):
+        return 'xml'
+    if head.startswith(b'<!doctype html') or head.startswith(b'<html'):
+        return 'html'
+    return 'text'
+
+
+def _is_mismatch(extension, kind):
+    '''扩展名与识别出的类型是否不一致'''
+    if kind in TYPE_EXTENSIONS:
+        return extension not in TYPE_EXTENSIONS[kind]
+    # 纯文本却使用了已知二进制格式的扩展名（如下载失败保存成 .jpg 的错误页面）
+    return kind == 'text' and extension in _BINARY_EXTENSIONS
+
+
+# 识别规则（签名表、校验）变化时递增，使旧缓存失效
+_SNIFF_CACHE_VERSION = 2
+
+
+class SniffCache:
+    '''
+    内容识别结果的持久化缓存（SQLite），以 (inode, mtime_ns) 为键，
+    文件未变化时重新运行无需再读取文件。
+    '''
+
+    def __init__(self, db_path):
+        import sqlite3  # 只有使用缓存时才需要
+
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        version, = self.conn.execute("PRAGMA user_version").fetchone()
+        if version != _SNIFF_CACHE_VERSION:
+            # 识别规则有变化，旧的结论不再可靠
+            self.conn.execute("DROP TABLE IF EXISTS sniff")
+            self.conn.execute(f"PRAGMA user_version = {_SNIFF_CACHE_VERSION}")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS sniff ("
+            " inode INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, kind TEXT NOT NULL,"
+            " PRIMARY KEY (inode, mtime_ns)) WITHOUT ROWID"
+        )
+        self.conn.commit()
+
+    def get(self, inode, mtime_ns, size):
+        row = self.conn.execute("SELECT size, kind FROM sniff WHERE inode = ? AND mtime_ns = ?",
+                                (inode, mtime_ns)).fetchone()
+        return row[1] if row is not None and row[0] == size else None
+
+    def put_many(self, records):
+        '''records: (inode, mtime_ns, size, kind) 的列表'''
+        self.conn.executemany("INSERT OR REPLACE INTO sniff VALUES (?, ?, ?, ?)", records)
+        self.conn.commit()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def _stat_path(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _read_header(path):
+    '''只读取文件开头的 SNIFF_SIZE 个字节'''
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    except OSError:
+        return None
+    try:
+        return os.read(fd, SNIFF_SIZE)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+class _ContentSniffer:
+    '''按目录批量识别文件内容：stat 和读取文件头都在线程池中并行执行'''
+
+    def __init__(self, cache=None, max_workers=16):
+        from concurrent.futures import ThreadPoolExecutor  # 只有开启内容识别时才需要
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.cache = cache
+        self.bytes_read = 0
+        self.files_read = 0
+        self.cache_hits = 0
+
+    def classify(self, paths):
+        '''返回与 paths 一一对应的类型名，无法读取的文件为 'unreadable' '''
+        kinds = [None] * len(paths)
+        to_read = []   # 需要读取的文件在 paths 中的下标
+        if self.cache is not None:
+            stats = list(self.executor.map(_stat_path, paths))
+            for index, st in enumerate(stats):
+                if st is not None:
+                    kinds[index] = self.cache.get(st.st_ino, st.st_mtime_ns, st.st_size)
+                    if kinds[index] is not None:
+                        self.cache_hits += 1
+                        continue
+                to_read.append(index)
+        else:
+            stats = [None] * len(paths)
+            to_read = list(range(len(paths)))
+
+        headers = self.executor.map(_read_header, [paths[index] for index in to_read])
+        records = []
+        for index, header in zip(to_read, headers):
+            if header is None:
+                kinds[index] = 'unreadable'
+                continue
+            self.bytes_read += len(header)
+            self.files_read += 1
+            kinds[index] = detect_content_type(header)
+            st = stats[index]
+            if st is not None:
+                records.append((st.st_ino, st.st_mtime_ns, st.st_size, kinds[index]))
+        if self.cache is not None and records:
+            self.cache.put_many(records)
+        return kinds
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+def FolderAnalysis(folder_path, verbose=0, max_depth=None, hidden=False, Logo=False,
+                   content_type=False, sniff_cache=None):
+    """
+    分析指定文件夹的结构和信息。
+    :param folder_path: 要分析的文件夹路径
+    :param verbose: 输出详细程度，0为详细，1为粗略，2为仅错误
+    :param max_depth: 最大遍历深度，None表示不限制
+    :param hidden: 是否包含隐藏文件和文件夹，默认为False
+    :param Logo: 是否打印Logo信息，默认为False
+    :param content_type: 是否按文件内容识别类型（每个文件只读取开头 SNIFF_SIZE 个字节），默认为False
+    :param sniff_cache: 内容识别缓存，SniffCache 对象或数据库路径，None表示不使用缓存
+    :return: 返回总文件数和文件类型分布；开启 content_type 时额外返回内容识别报告
+             （types: 内容类型分布，mismatches: 扩展名与内容不一致的 (路径, 扩展名, 类型) 列表，
+             bytes_read: 实际读取的字节数，cache_hits: 缓存命中数）
+    """
+    print("\n******--------------> 文件夹分析工具 <--------------******")
+
+    # 是否打印 Logo
+    if not Logo:
+        print()
+    else:
+        print("******----------------> 作者：qhk <----------------******")
+        print("******---------------> 版本：1.0.0 <---------------******")
+        print("******--------> 功能：分析文件夹结构和信息 <--------******\n")
+
+    # 初始化统计变量
+    folder_path = os.path.normpath(folder_path)
+    total_files = 0
+    total_file_types = defaultdict(int)
+    analyzed = False  # 用于标记是否已经分析过目录
+    folder = _get_folder_name(folder_path)  # 获取文件夹名称
+
+    # 内容识别（可选）
+    sniffer = None
+    own_cache = False
+    total_content_types = defaultdict(int)
+    mismatches = []
+    if content_type:
+        if isinstance(sniff_cache, (str, os.PathLike)):
+            sniff_cache = SniffCache(sniff_cache)
+            own_cache = True
+        sniffer = _ContentSniffer(cache=sniff_cache)
+
+    # 使用队列进行广度优先遍历
+    queue = deque([(folder_path, 0)])
+    
+    # 如果verbose为0或1，打印开始信息
+    if verbose == 0 or verbose == 1:
+        print(f"开始遍历文件夹: {folder}\n" + "="*50)
+
+    # 遍历队列（分析文件结构）
+    try:
+        while queue:
+            current_dir, level = queue.popleft()    # 从队列中取出当前目录和层级
+
+            # 检查是否达到最大深度
+            if max_depth is not None and level > max_depth:
+                continue
+            try:
+                items = os.listdir(current_dir)  # 获取当前目录下的所有项目
+            except (PermissionError):
+                if verbose == 0 or verbose == 1:
+                    print(f"无权限访问目录: {current_dir}")
+                continue
+            except FileNotFoundError:
+                if verbose == 0 or verbose == 1:
+                    print(f"目录不存在: {current_dir}")
+                continue
+            except OSError as e:
+                if verbose == 0 or verbose == 1:
+                    print(f"访问目录时发生错误: {e}")
+                continue
+            except Exception as e:
+                if verbose == 0 or verbose == 1:
+                    print(f"发生未知错误: {e}")
+                continue
+
+            # 初始化当前层统计
+            folder_names = []
+            file_count = 0
+            current_file_types = defaultdict(int)
+            current_content_types = defaultdict(int)
+            sniff_files = []  # 需要识别内容的文件：(路径, 扩展名)
+
+            # 遍历当前层项目
+            for item in items:
+
+                # 跳过隐藏文件和文件夹（如果需要）
+                if not hidden and item.startswith('.'):
+                    continue
+                path = os.path.join(current_dir, item)
+
+                # 判断是否为文件夹
+                if os.path.isdir(path):
+                    folder_names.append(item)        # 存储文件夹名称
+                    queue.append((path, level + 1))  # 加入队列，层级加一
+                else:
+                    file_count += 1
+                    _folder_name, extension = os.path.splitext(item)
+                    if sniffer is not None:
+                        sniff_files.append((path, extension.lower()))  # 识别内容后再统计
+                        continue
+                    file_type = extension.lower() if extension else '无扩展名'
+                    current_file_types[file_type] += 1  # 增加当前文件类型的数量
+                    total_file_types[file_type] += 1    # 增加总文件类型的数量
+            total_files += file_count  # 累加总文件数量
+
+            # 按内容识别当前层文件（整层一起提交给线程池）
+            if sniff_files:
+                kinds = sniffer.classify([path for path, _extension in sniff_files])
+                for (path, extension), kind in zip(sniff_files, kinds):
+                    file_type = extension if extension else f'无扩展名[{kind}]'  # 无扩展名文件按内容细分
+                    current_file_types[file_type] += 1
+                    total_file_types[file_type] += 1
+                    current_content_types[kind] += 1
+                    total_content_types[kind] += 1
+                    if extension and _is_mismatch(extension, kind):
+                        mismatches.append((path, extension, kind))
+                        if verbose == 0:
+                            print(f"扩展名与内容不一致: {path} ({extension} -> {kind})")
+
+            # 如果verbose为0，打印当前层信息
+            if verbose == 0:
+                # 输出当前层信息
+                indent = "│   " * level                                     # 根据层级生成缩进
+                print(f"{indent}├── [层级 {level}] {current_dir}")           # 输出当前文件夹的路径和层级
+                print(f"{indent}│   ├── 文件夹数量: {len(folder_names)}")    # 输出当前文件夹中的文件夹数量
+                print(f"{indent}│   ├── 文件数量: {file_count}")             # 输出当前文件夹中的文件数量
+
+                # 输出文件夹名称（每行最多显示10个）
+                if folder_names:  # 如果有文件夹
+                    print(f"{indent}│   ├── 文件夹名称:")             # 输出文件夹名称的提示
+                    per_line = 10                                     # 每行显示的文件夹数量
+                    lines = math.ceil(len(folder_names) / per_line)   # 计算需要的行数
+                    for i in range(lines):  # 遍历每一行
+                        start = i * per_line                               # 计算当前行的起始索引
+                        end = start + per_line                             # 计算当前行的结束索引
+                        folders_line = ', '.join(folder_names[start:end])  # 拼接当前行的文件夹名称
+                        print(f"{indent}│   │   ├── {folders_line}")       # 输出当前行的文件夹名称
+                else:  # 如果没有文件夹
+                    print(f"{indent}│   ├── 文件夹名称: 无")          # 输出无文件夹的提示
+
+                # 输出文件类型分布
+                if file_count > 0:
+                    print(f"{indent}|   |—— 文件类型分布:")                  # 输出文件类型分布的提示
+                    for file_type, count in current_file_types.items():     # 遍历当前文件夹中的文件类型和数量
+                        print(f"{indent}│   │   ├── {file_type}: {count}")  # 输出当前文件类型和数量
+                    if current_content_types:
+                        print(f"{indent}|   |—— 内容类型分布:")
+                        for kind, count in current_content_types.items():
+                            print(f"{indent}│   │   ├── {kind}: {count}")
+                else:
+                    print(f"{indent}│   │── 无文件")                     # 输出无文件的提示
+
+                # 输出文件夹结束提示
+                if folder_names:
+                    print(f"{indent}\n{indent}▼")  # 输出文件夹展开的提示
+                else:
+                    print(f"{indent}|")            # 输出文件夹结束的提示
+
+            analyzed = True         # 标记已分析过目录
+    finally:
+        # 遍历中途出错时也要关闭线程池和缓存数据库
+        if sniffer is not None:
+            sniffer.close()
+        if own_cache:
+            sniff_cache.close()
+        
+    # 输出总统计信息
+    if verbose == 0 or verbose == 1:
+        if verbose == 0:
+            print("\n" + "="*50)
+        print(f"文件夹: {folder} 分析完成!")
+        print(f"|——总文件数量: {total_files}")
+        print("└──文件类型分布:")
+        if total_files > 0:
+            for file_type, count in total_file_types.items():
+                print(f"    ├── {file_type}: {count}")
+        else:
+            print("├── 无文件")
+        if sniffer is not None:
+            print("└──内容类型分布:")
+            for kind, count in sorted(total_content_types.items(), key=lambda item: -item[1]):
+                print(f"    ├── {kind}: {count}")
+            print(f"|——扩展名与内容不一致: {len(mismatches)}")
+            print(f"|——读取字节数: {sniffer.bytes_read} (读取 {sniffer.files_read} 个文件，缓存命中 {sniffer.cache_hits})")
+        
+    print("\n******------------> 文件夹内容统计工具 <------------******\n")
+
+    if sniffer is None:
+        return total_files, dict(total_file_types)
+
+    content_report = {
+        'types': dict(total_content_types),
+        'mismatches': mismatches,
+        'bytes_read': sniffer.bytes_read,
+        'cache_hits': sniffer.cache_hits,
+    }
+    return total_files, dict(total_file_types), content_report
+
+
+def main(argv=None):
+    '''命令行入口'''
+    import argparse
+
+    parser = argparse.ArgumentParser(description="分析文件夹的结构和信息")
+    parser.add_argument('folder', help="要分析的文件夹路径")
+    parser.add_argument('--verbose', type=int, choices=(0, 1, 2), default=1, help="0为详细，1为粗略，2为仅错误")
+    parser.add_argument('--max-depth', type=int, default=None, help="最大遍历深度")
+    parser.add_argument('--hidden', action='store_true', help="包含隐藏文件和文件夹")
+    parser.add_argument('--logo', action='store_true', help="打印Logo信息")
+    parser.add_argument('--content-type', action='store_true', help="按文件内容识别类型并报告扩展名不一致的文件")
+    parser.add_argument('--sniff-cache', default=None, help="内容识别缓存数据库路径（需配合 --content-type）")
+    args = parser.parse_args(argv)
+
+    FolderAnalysis(args.folder, verbose=args.verbose, max_depth=args.max_depth, hidden=args.hidden, Logo=args.logo,
+                   content_type=args.content_type or args.sniff_cache is not None, sniff_cache=args.sniff_cache)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+import os
+import sys
+import mmap
+import json
+import struct
+import argparse
+
+from .common import walk_files, BoundedSubmitter
+
+# 替换为你的 .lib 文件路径
+lib_file_path = "C:\\Users\\hh\\.conda\\envs\\3xpy36\\Library\\lib\\boost_chrono.lib"
+
+LIB_EXTENSIONS = ('.lib', '.a')
+
+_ARCHIVE_SIGNATURE = b'!<arch>\n'
+_MEMBER_HEADER_SIZE = 60
+_IMPORT_HEADER = struct.Struct('<HHHHIIHH')  # Sig1, Sig2, Version, Machine, TimeDateStamp, SizeOfData, OrdinalHint, Type
+
+_MACHINES = {0x14c: 'x86', 0x8664: 'x64', 0xaa64: 'arm64', 0x1c4: 'arm', 0x200: 'ia64'}
+_IMPORT_TYPES = {0: 'code', 1: 'data', 2: 'const'}
+
+# 导入库中由链接器生成的辅助符号，不属于导出函数
+_HELPER_PREFIXES = ('__IMPORT_DESCRIPTOR_', '__NULL_IMPORT_DESCRIPTOR', '\x7f')
+
+
+class ArchiveError(ValueError):
+    '''不是合法的 COFF 归档文件'''
+
+
+def _member_header(data, offset):
+    '''解析 offset 处的成员头，返回 (名称, 数据起始位置, 数据大小)'''
+    header = data[offset:offset + _MEMBER_HEADER_SIZE]
+    if len(header) < _MEMBER_HEADER_SIZE or header[58:60] != b'`\n':
+        raise ArchiveError(f"偏移 {offset} 处的成员头无效")
+    name = header[:16].decode('latin-1').rstrip()
+    size = int(header[48:58].decode('ascii').strip() or 0)
+    return name, offset + _MEMBER_HEADER_SIZE, size
+
+
+def _read_cstrings(data, start, end, count):
+    '''从 data[start:end] 中读取 count 个以 \\0 结尾的字符串'''
+    names = []
+    pos = start
+    for _ in range(count):
+        zero = data.find(b'\0', pos, end)
+        if zero == -1:
+            raise ArchiveError("符号表字符串被截断")
+        names.append(data[pos:zero].decode('latin-1'))
+        pos = zero + 1
+    return names
+
+
+def _read_symbol_table(data):
+    '''
+    读取链接器成员中的符号表，返回 (符号名, 成员偏移) 列表以及长名称表的位置。
+    优先使用第二链接器成员（小端序、带成员索引，Microsoft 格式），
+    没有时使用第一链接器成员（大端序，GNU 格式也只有这一个）。
+    '''
+    offset = len(_ARCHIVE_SIGNATURE)
+    first = second = longnames = None
+    # 链接器成员和长名称成员只会出现在归档开头，最多读取三个成员头
+    for _ in range(3):
+        if offset + _MEMBER_HEADER_SIZE > len(data):
+            break
+        name, start, size = _member_header(data, offset)
+        if name == '/':
+            if first is None:
+                first = (start, size)
+            else:
+                second = (start, size)
+        elif name == '//':
+            longnames = (start, size)
+        else:
+            break
+        offset = start + size + (size & 1)
+
+    symbols = []
+    if second is not None:
+        start, size = second
+        end = start + size
+        member_count, = struct.unpack_from('<I', data, start)
+        offsets = struct.unpack_from(f'<{member_count}I', data, start + 4)
+        pos = start + 4 + 4 * member_count
+        symbol_count, = struct.unpack_from('<I', data, pos)
+        indices = struct.unpack_from(f'<{symbol_count}H', data, pos + 4)
+        names = _read_cstrings(data, pos + 4 + 2 * symbol_count, end, symbol_count)
+        symbols = []
+        for name, index in zip(names, indices):
+            # 成员索引从 1 开始；0 会被 Python 当作 offsets[-1]
+            if not 1 <= index <= member_count:
+                raise ArchiveError(f"符号 {name} 的成员索引 {index} 超出范围（共 {member_count} 个成员）")
+            symbols.append((name, offsets[index - 1]))
+    elif first is not None:
+        start, size = first
+        end = start + size
+        symbol_count, = struct.unpack_from('>I', data, start)
+        offsets = struct.unpack_from(f'>{symbol_count}I', data, start + 4)
+        names = _read_cstrings(data, start + 4 + 4 * symbol_count, end, symbol_count)
+        symbols = list(zip(names, offsets))
+    return symbols, longnames
+
+
+def _member_name(name, data, longnames):
+    '''解析成员名称（/123 形式表示长名称表中的偏移）'''
+    if name.startswith('/') and name[1:].isdigit() and longnames is not None:
+        start, size = longnames
+        pos = start + int(name[1:])
+        end = start + size
+        stop = min(i for i in (data.find(b'\0', pos, end), data.find(b'/\n', pos, end), end) if i != -1)
+        return data[pos:stop].decode('latin-1')
+    return name.rstrip('/')
+
+
+def _export_name(symbol, name_type):
+    '''按导入头中的 NameType 计算 DLL 中实际导出的名称'''
+    if name_type in (2, 3):  # NAME_NOPREFIX / NAME_UNDECORATE：只去掉一个 ? @ _ 前缀
+        symbol = symbol[1:] if symbol[:1] in ('?', '@', '_') else symbol
+    if name_type == 3:  # NAME_UNDECORATE：截断到第一个 @
+        symbol = symbol.split('@', 1)[0]
+    return symbol
+
+
+def _parse_member(data, offset, longnames):
+    '''解析符号表指向的成员：短导入头返回导入信息，否则视为普通目标文件'''
+    name, start, size = _member_header(data, offset)
+    sig1, sig2 = struct.unpack_from('<HH', data, start) if size >= 4 else (None, None)
+    if sig1 == 0 and sig2 == 0xFFFF and size >= _IMPORT_HEADER.size:
+        _, _, _, machine, _, data_size, ordinal_hint, type_bits = _IMPORT_HEADER.unpack_from(data, start)
+        symbol, dll = _read_cstrings(data, start + _IMPORT_HEADER.size, start + size, 2)
+        import_type = type_bits & 0x3
+        name_type = (type_bits >> 2) & 0x7
+        export = {
+            'name': _export_name(symbol, name_type),
+            'symbol': symbol,
+            'dll': dll,
+            'type': _IMPORT_TYPES.get(import_type, str(import_type)),
+            'machine': _MACHINES.get(machine, hex(machine)),
+        }
+        # NameType 为 0 时按序号导入，否则 OrdinalHint 只是提示
+        export['ordinal' if name_type == 0 else 'hint'] = ordinal_hint
+        return export
+    return {'member': _member_name(name, data, longnames)}
+
+
+def read_lib_exports(file_path):
+    '''
+    通过 mmap 读取 COFF 归档（.lib 导入库或静态库），列出其中的导出符号。
+    只读取链接器成员中的符号表以及符号所指向的成员头，不遍历所有成员。
+
+    :param file_path: .lib 文件路径
+    :return: 字典，包含 path、machine、exports（导入库中的 DLL 导出）和 objects（静态库中的公共符号）
+    '''
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < len(_ARCHIVE_SIGNATURE):
+            raise ArchiveError("文件太小")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(_ARCHIVE_SIGNATURE)] != _ARCHIVE_SIGNATURE:
+                raise ArchiveError("缺少 !<arch> 签名")
+            symbols, longnames = _read_symbol_table(data)
+
+            exports = []
+            objects = []
+            members = {}  # 成员偏移 -> 解析结果（__imp_X 与 X 指向同一个成员）
+            machines = set()
+            for symbol, offset in symbols:
+                if symbol.startswith(_HELPER_PREFIXES):
+                    continue
+                if offset not in members:
+                    members[offset] = _parse_member(data, offset, longnames)
+                    if 'dll' in members[offset]:
+                        exports.append(members[offset])
+                        machines.add(members[offset]['machine'])
+                member = members[offset]
+                if 'dll' in member:
+                    continue
+                if symbol.startswith('__imp_'):
+                    # 长格式导入库：导入信息在目标文件的 .idata 节中，只能给出符号名
+                    exports.append({'name': symbol[len('__imp_'):], 'symbol': symbol, 'dll': None})
+                else:
+                    objects.append({'symbol': symbol, 'member': member['member']})
+
+    return {
+        'path': file_path,
+        'machine': machines.pop() if len(machines) == 1 else sorted(machines) or None,
+        'exports': exports,
+        'objects': objects,
+    }
+
+
+def _read_lib_file(file_path):
+    '''在子进程中读取单个 .lib，出错时返回带 error 字段的结果'''
+    try:
+        return read_lib_exports(file_path)
+    except (OSError, ValueError, IndexError, struct.error) as e:
+        return {'path': file_path, 'error': f"{type(e).__name__}: {e}"}
+
+
+def iter_lib_exports(folder_path, extensions=LIB_EXTENSIONS, max_workers=None):
+    '''
+    在进程池中并行读取目录下所有 .lib 文件，逐个产出 read_lib_exports 的结果。
+
+    :param folder_path: 要处理的目录（例如 conda 环境的 Library/lib）
+    :param extensions: 需要处理的文件扩展名
+    :param max_workers: 进程池大小，None 表示使用 CPU 核数
+    '''
+    from concurrent.futures import ProcessPoolExecutor  # 延迟导入，加快启动
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        submitter = BoundedSubmitter(executor, 8 * max_workers)
+        for entry in walk_files(folder_path, extensions):
+            yield from submitter.submit(_read_lib_file, entry.path)
+        yield from submitter.drain()
+
+
+def view_lib(file_path):
+    '''打印单个 .lib 的导出（相当于 dumpbin /exports）'''
+    try:
+        result = read_lib_exports(file_path)
+    except (OSError, ValueError, IndexError, struct.error) as e:
+        print(f"读取 .lib 文件时出错: {e}")
+        return
+    print(f"文件: {result['path']}")
+    print(f"平台: {result['machine']}")
+    print(f"导出数量: {len(result['exports'])}")
+    for export in result['exports']:
+        ordinal = f"  @{export['ordinal']}" if 'ordinal' in export else ''
+        print(f"  {export['name']}{ordinal}  ({export['dll']})")
+    if result['objects']:
+        print(f"公共符号数量（静态库）: {len(result['objects'])}")
+        for obj in result['objects']:
+            print(f"  {obj['symbol']}  ({obj['member']})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="COFF 导入库（.lib）导出查看，无需 dumpbin")
+    sub = parser.add_subparsers(dest='command')
+
+    show = sub.add_parser('show', help="打印单个 .lib 的导出")
+    show.add_argument('file', nargs='?', default=lib_file_path)
+
+    scan = sub.add_parser('scan', help="并行处理目录下所有 .lib，输出 JSON Lines")
+    scan.add_argument('folder')
+    scan.add_argument('--output', '-o', help="输出文件，默认输出到标准输出")
+    scan.add_argument('--workers', type=int, default=None, help="进程数")
+
+    args = parser.parse_args(argv)
+
+    if args.command in (None, 'show'):
+        view_lib(getattr(args, 'file', lib_file_path))
+    elif args.command == 'scan':
+        out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+        try:
+            count = errors = 0
+            for result in iter_lib_exports(args.folder, max_workers=args.workers):
+                out.write(json.dumps(result, ensure_ascii=False) + '\n')
+                count += 1
+                errors += 'error' in result
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        print(f"共处理 {count} 个文件，失败 {errors} 个", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
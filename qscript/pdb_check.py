@@ -0,0 +1,270 @@
+import os
+import sys
+import time
+import sqlite3
+import argparse
+
+from .common import walk_files, stale_paths, BoundedSubmitter
+
+# 符号类型（S_PUB32 的 symtype 字段）
+_SYMBOL_KINDS = {0: 'data', 2: 'function'}
+
+
+def view_pdb(file_path):
+    import pdbparse  # 延迟导入，只有真正解析 PDB 文件时才加载 pdbparse
+
+    try:
+        # 打开 PDB 文件
+        with pdbparse.parse(file_path) as pdb:
+            # 打印基本信息
+            print(f"PDB 文件签名: {pdb.Signature}")
+            print(f"PDB 文件版本: {pdb.DBI.Version}")
+
+            # 遍历全局符号
+            if hasattr(pdb.DBI, 'GlobalSymbols'):
+                for symbol in pdb.DBI.GlobalSymbols:
+                    print(f"全局符号: {symbol.name}")
+
+            # 遍历公共符号
+            if hasattr(pdb.DBI, 'PublicSymbols'):
+                for symbol in pdb.DBI.PublicSymbols:
+                    print(f"公共符号: {symbol.name}")
+
+    except Exception as e:
+        print(f"读取 PDB 文件时出错: {e}")
+
+
+def extract_symbols(file_path):
+    '''
+    提取 PDB 文件中的全局/公共符号。
+    使用 fast_load 打开，只读取 DBI 流和全局符号流，不解析类型信息等其他流。
+    返回 (符号名, 类型) 列表。
+    '''
+    import pdbparse
+
+    pdb = pdbparse.parse(file_path, fast_load=True)
+    try:
+        pdb.STREAM_DBI.load()
+        pdb._update_names()  # DBI 加载后才知道全局符号流的编号
+        if not hasattr(pdb, 'STREAM_GSYM'):
+            return []
+        gsym = pdb.STREAM_GSYM.reload()
+        if gsym.size <= 0:
+            return []
+        gsym.load()
+        return [(g.name, _SYMBOL_KINDS.get(g.symtype, str(g.symtype)))
+                for g in gsym.globals if getattr(g, 'name', None)]
+    finally:
+        pdb.fp.close()
+
+
+def _extract_file(file_path):
+    '''在子进程中提取单个 PDB 的符号'''
+    result = {'path': file_path, 'symbols': [], 'error': None}
+    try:
+        st = os.stat(file_path)
+        result['size'], result['mtime_ns'] = st.st_size, st.st_mtime_ns
+        result['symbols'] = extract_symbols(file_path)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def _fts5_trigram_available(conn):
+    '''SQLite 是否支持 FTS5 的 trigram 分词（3.34+），用于子串搜索'''
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._trigram_probe USING fts5(x, tokenize='trigram')")
+        conn.execute("DROP TABLE temp._trigram_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+class PDBSymbolIndex:
+    '''
+    多个 PDB 文件的符号索引（SQLite）。
+
+    符号名上建有 B 树索引用于前缀搜索；SQLite 支持时另建 FTS5 trigram 索引用于子串搜索，
+    否则子串搜索退化为 LIKE 扫描。
+    '''
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS pdbs ("
+            " id INTEGER PRIMARY KEY, path TEXT UNIQUE, size INTEGER, mtime_ns INTEGER, error TEXT);"
+            "CREATE TABLE IF NOT EXISTS symbols (pdb_id INTEGER, name TEXT, kind TEXT);"
+            "CREATE INDEX IF NOT EXISTS symbols_name ON symbols (name);"
+            "CREATE INDEX IF NOT EXISTS symbols_pdb ON symbols (pdb_id);"
+        )
+        self.fts = _fts5_trigram_available(self.conn)
+        if self.fts:
+            self.conn.executescript(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS symbols_fts USING fts5("
+                " name, content='symbols', content_rowid='rowid', tokenize='trigram');"
+                "CREATE TRIGGER IF NOT EXISTS symbols_ai AFTER INSERT ON symbols BEGIN"
+                " INSERT INTO symbols_fts (rowid, name) VALUES (new.rowid, new.name); END;"
+                "CREATE TRIGGER IF NOT EXISTS symbols_ad AFTER DELETE ON symbols BEGIN"
+                " INSERT INTO symbols_fts (symbols_fts, rowid, name) VALUES ('delete', old.rowid, old.name); END;"
+            )
+        self.conn.commit()
+
+    def is_unchanged(self, path, size, mtime_ns):
+        '''文件未变化且上次解析成功时返回 True；解析失败的PDB每次都重试（例如之后才安装了依赖）'''
+        row = self.conn.execute("SELECT size, mtime_ns FROM pdbs WHERE path = ? AND error IS NULL",
+                                (path,)).fetchone()
+        return row == (size, mtime_ns)
+
+    def _remove(self, path):
+        row = self.conn.execute("SELECT id FROM pdbs WHERE path = ?", (path,)).fetchone()
+        if row is not None:
+            self.conn.execute("DELETE FROM symbols WHERE pdb_id = ?", row)
+            self.conn.execute("DELETE FROM pdbs WHERE id = ?", row)
+
+    def add(self, result):
+        '''写入 _extract_file 的结果（替换该路径原有的符号）'''
+        self._remove(result['path'])
+        cur = self.conn.execute("INSERT INTO pdbs (path, size, mtime_ns, error) VALUES (?, ?, ?, ?)",
+                                (result['path'], result.get('size'), result.get('mtime_ns'), result['error']))
+        pdb_id = cur.lastrowid
+        self.conn.executemany("INSERT INTO symbols VALUES (?, ?, ?)",
+                              ((pdb_id, name, kind) for name, kind in result['symbols']))
+        self.conn.commit()
+
+    def prune(self, folder_path, seen_paths):
+        '''删除 folder_path 下已不存在的 PDB 的符号'''
+        stale = stale_paths(self.conn, 'pdbs', folder_path, seen_paths)
+        for path in stale:
+            self._remove(path)
+        self.conn.commit()
+        return len(stale)
+
+    def search(self, text, mode='prefix', limit=100):
+        '''
+        搜索符号，返回 (符号名, 类型, PDB 路径) 列表。
+        :param mode: 'exact' 精确匹配，'prefix' 前缀匹配，'substring' 子串匹配（不区分大小写）
+        '''
+        select = "SELECT s.name, s.kind, p.path FROM symbols s JOIN pdbs p ON p.id = s.pdb_id "
+        if mode == 'exact':
+            sql, params = select + "WHERE s.name = ?", [text]
+        elif mode == 'prefix':
+            sql, params = select + "WHERE s.name >= ? AND s.name < ?", [text, text + '\U0010ffff']
+        elif mode == 'substring':
+            if self.fts and len(text) >= 3:
+                phrase = '"' + text.replace('"', '""') + '"'
+                sql = select + "WHERE s.rowid IN (SELECT rowid FROM symbols_fts WHERE symbols_fts MATCH ?)"
+                params = [phrase]
+            else:
+                escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+                sql, params = select + "WHERE s.name LIKE ? ESCAPE '\\'", [f"%{escaped}%"]
+        else:
+            raise ValueError(f"未知的搜索方式: {mode}")
+        return self.conn.execute(sql + " LIMIT ?", params + [limit]).fetchall()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def build_index(folder_path, index, max_workers=None, verbose=True):
+    '''
+    遍历文件夹，在进程池中并行提取所有 PDB 的符号，并逐个写入索引。
+
+    :param folder_path: 要索引的目录
+    :param index: PDBSymbolIndex 对象
+    :param max_workers: 进程池大小，None 表示使用 CPU 核数
+    :param verbose: 是否打印解析失败的文件
+    :return: 统计信息字典（total/skipped/indexed/errors/symbols）
+    '''
+    folder_path = os.path.abspath(folder_path)
+    stats = {'total': 0, 'skipped': 0, 'indexed': 0, 'errors': 0, 'symbols': 0}
+    seen_paths = set()
+
+    def collect(result):
+        index.add(result)
+        if result['error']:
+            stats['errors'] += 1
+            if verbose:
+                print(f"解析失败: {result['path']} ({result['error']})")
+        else:
+            stats['indexed'] += 1
+            stats['symbols'] += len(result['symbols'])
+
+    from concurrent.futures import ProcessPoolExecutor  # 延迟导入，加快启动
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # 单个 PDB 的符号表可能很大，只保留少量尚未写入的结果
+        submitter = BoundedSubmitter(executor, 2 * max_workers)
+        for entry in walk_files(folder_path, ('.pdb',)):
+            stats['total'] += 1
+            seen_paths.add(entry.path)
+            try:
+                st = entry.stat()
+                if index.is_unchanged(entry.path, st.st_size, st.st_mtime_ns):
+                    stats['skipped'] += 1
+                    continue
+            except OSError:
+                pass
+            for result in submitter.submit(_extract_file, entry.path):
+                collect(result)
+        for result in submitter.drain():
+            collect(result)
+
+    index.prune(folder_path, seen_paths)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PDB 符号查看与索引")
+    sub = parser.add_subparsers(dest='command')
+
+    show = sub.add_parser('show', help="打印单个 PDB 的信息")
+    show.add_argument('file', nargs='?', default=pdb_file_path)
+
+    scan = sub.add_parser('scan', help="并行提取目录下所有 PDB 的符号并建立索引")
+    scan.add_argument('folder')
+    scan.add_argument('--index', default='pdb_index.db', help="索引数据库路径")
+    scan.add_argument('--workers', type=int, default=None, help="进程数")
+
+    search = sub.add_parser('search', help="在索引中搜索符号")
+    search.add_argument('text')
+    search.add_argument('--mode', choices=('exact', 'prefix', 'substring'), default='prefix')
+    search.add_argument('--limit', type=int, default=100)
+    search.add_argument('--index', default='pdb_index.db')
+
+    args = parser.parse_args(argv)
+
+    if args.command in (None, 'show'):
+        view_pdb(getattr(args, 'file', pdb_file_path))
+    elif args.command == 'scan':
+        with PDBSymbolIndex(args.index) as index:
+            stats = build_index(args.folder, index, max_workers=args.workers)
+        print(f"共 {stats['total']} 个 PDB，跳过未变化 {stats['skipped']} 个，索引 {stats['indexed']} 个"
+              f"（{stats['symbols']} 个符号），失败 {stats['errors']} 个")
+    elif args.command == 'search':
+        with PDBSymbolIndex(args.index) as index:
+            start = time.perf_counter()
+            rows = index.search(args.text, mode=args.mode, limit=args.limit)
+            elapsed = (time.perf_counter() - start) * 1000
+        for name, kind, path in rows:
+            print(f"{name}\t{kind}\t{path}")
+        print(f"共 {len(rows)} 条结果，用时 {elapsed:.1f} ms")
+
+
+pdb_file_path = "C:/Users/hh/.conda/envs/3xpy36/Library/lib/engines-1_1/padlock.pdb"
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+import os
+import sys
+import mmap
+import hashlib
+import sqlite3
+import argparse
+
+from .common import walk_files, stale_paths, BoundedSubmitter
+
+# 替换为你的 .pyd 文件路径
+pyd_file = 'C:\\Users\\hh\\.conda\\envs\\3xpy36\\DLLs\\_asyncio.pyd'
+
+PE_EXTENSIONS = ('.pyd', '.dll', '.exe')
+
+# 只解析导入表、延迟导入表和导出表
+_DIRECTORIES = (
+    'IMAGE_DIRECTORY_ENTRY_IMPORT',
+    'IMAGE_DIRECTORY_ENTRY_DELAY_IMPORT',
+    'IMAGE_DIRECTORY_ENTRY_EXPORT',
+)
+
+
+def view_pyd(file_path):
+    '''打印单个 PE 文件的节和导入表'''
+    import pefile  # 延迟导入，只有真正解析 PE 文件时才加载 pefile
+
+    try:
+        pe = pefile.PE(file_path)
+        print("Sections:")
+        for section in pe.sections:
+            # 提前处理去除空字符
+            section_name = section.Name.decode().rstrip('\x00')
+            print(f"  Name: {section_name}, Size: {section.SizeOfRawData}")
+
+        print("\nImports:")
+        if hasattr(pe, 'DIRECTORY_ENTRY_IMPORT'):
+            for entry in pe.DIRECTORY_ENTRY_IMPORT:
+                print(f"  DLL: {entry.dll.decode()}")
+                for imp in entry.imports:
+                    print(f"    Function: {imp.name.decode() if imp.name else imp.ordinal}")
+    except Exception as e:
+        print(f"Error: {e}")
+
+
+def _symbol_name(name, ordinal):
+    '''符号名，按序号导入/导出的符号记为 #序号'''
+    return name.decode('latin-1') if name else f"#{ordinal}"
+
+
+def parse_pe_tables(data):
+    '''
+    用 fast_load 解析 PE 数据，只加载导入/导出目录。
+    返回 (machine, imports, exports)，imports 为 (dll, 符号, 是否延迟导入) 列表，exports 为 (符号, 序号) 列表。
+    '''
+    import pefile
+
+    pe = pefile.PE(data=data, fast_load=True)
+    try:
+        pe.parse_data_directories(directories=[pefile.DIRECTORY_ENTRY[name] for name in _DIRECTORIES])
+        imports = []
+        for attr, delay in (('DIRECTORY_ENTRY_IMPORT', 0), ('DIRECTORY_ENTRY_DELAY_IMPORT', 1)):
+            for entry in getattr(pe, attr, ()):
+                dll = entry.dll.decode('latin-1').lower()
+                for imp in entry.imports:
+                    imports.append((dll, _symbol_name(imp.name, imp.ordinal), delay))
+        exports = []
+        if hasattr(pe, 'DIRECTORY_ENTRY_EXPORT'):
+            for sym in pe.DIRECTORY_ENTRY_EXPORT.symbols:
+                exports.append((_symbol_name(sym.name, sym.ordinal), sym.ordinal))
+        return pe.FILE_HEADER.Machine, imports, exports
+    finally:
+        pe.close()
+
+
+# 子进程中已知的内容哈希（索引中已有解析结果的文件无需再次解析）
+_known_hashes = frozenset()
+
+
+def _init_worker(known_hashes):
+    global _known_hashes
+    _known_hashes = known_hashes
+
+
+def _analyze_file(file_path):
+    '''在子进程中通过 mmap 计算文件哈希，并在内容未知时解析导入/导出表'''
+    result = {'path': file_path, 'sha256': None, 'parsed': False, 'error': None}
+    try:
+        with open(file_path, 'rb') as f:
+            st = os.fstat(f.fileno())
+            result['size'], result['mtime_ns'] = st.st_size, st.st_mtime_ns
+            if st.st_size == 0:
+                raise ValueError("空文件")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                sha256 = hashlib.sha256(data).hexdigest()
+                result['sha256'] = sha256
+                if sha256 not in _known_hashes:
+                    result['machine'], result['imports'], result['exports'] = parse_pe_tables(data)
+                    result['parsed'] = True
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    return result
+
+
+class PEImportIndex:
+    '''
+    PE 导入/导出的反向索引（SQLite）。
+
+    解析结果按文件内容的 SHA-256 保存，文件路径只记录到哈希的映射，
+    因此相同内容的文件只解析一次，(大小, mtime_ns) 未变化的文件重新审计时直接跳过。
+    '''
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, sha256 TEXT, error TEXT);"
+            "CREATE TABLE IF NOT EXISTS binaries (sha256 TEXT PRIMARY KEY, machine INTEGER);"
+            "CREATE TABLE IF NOT EXISTS imports (sha256 TEXT, dll TEXT, symbol TEXT, delay INTEGER);"
+            "CREATE TABLE IF NOT EXISTS exports (sha256 TEXT, symbol TEXT, ordinal INTEGER);"
+            "CREATE INDEX IF NOT EXISTS files_sha256 ON files (sha256);"
+            "CREATE INDEX IF NOT EXISTS imports_dll ON imports (dll, symbol);"
+            "CREATE INDEX IF NOT EXISTS imports_symbol ON imports (symbol);"
+            "CREATE INDEX IF NOT EXISTS imports_sha256 ON imports (sha256);"
+            "CREATE INDEX IF NOT EXISTS exports_symbol ON exports (symbol);"
+            "CREATE INDEX IF NOT EXISTS exports_sha256 ON exports (sha256);"
+        )
+        self.conn.commit()
+
+    def known_hashes(self):
+        return frozenset(sha256 for sha256, in self.conn.execute("SELECT sha256 FROM binaries"))
+
+    def is_unchanged(self, path, size, mtime_ns):
+        '''文件未变化且上次解析成功时返回 True；解析失败的文件每次都重试（例如之后才安装了依赖）'''
+        row = self.conn.execute("SELECT size, mtime_ns FROM files WHERE path = ? AND error IS NULL",
+                                (path,)).fetchone()
+        return row == (size, mtime_ns)
+
+    def add(self, result):
+        '''写入 _analyze_file 的结果'''
+        sha256 = result['sha256']
+        if result['parsed']:
+            self.conn.execute("INSERT OR REPLACE INTO binaries VALUES (?, ?)", (sha256, result['machine']))
+            self.conn.execute("DELETE FROM imports WHERE sha256 = ?", (sha256,))
+            self.conn.execute("DELETE FROM exports WHERE sha256 = ?", (sha256,))
+            self.conn.executemany("INSERT INTO imports VALUES (?, ?, ?, ?)",
+                                  ((sha256, dll, symbol, delay) for dll, symbol, delay in result['imports']))
+            self.conn.executemany("INSERT INTO exports VALUES (?, ?, ?)",
+                                  ((sha256, symbol, ordinal) for symbol, ordinal in result['exports']))
+        self.conn.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)",
+                          (result['path'], result.get('size'), result.get('mtime_ns'),
+                           sha256 if result['error'] is None else None, result['error']))
+
+    def prune(self, folder_path, seen_paths):
+        '''删除 folder_path 下已不存在的文件，以及不再被任何文件引用的解析结果'''
+        stale = [(path,) for path in stale_paths(self.conn, 'files', folder_path, seen_paths)]
+        self.conn.executemany("DELETE FROM files WHERE path = ?", stale)
+        for table in ('binaries', 'imports', 'exports'):
+            self.conn.execute(f"DELETE FROM {table} WHERE sha256 NOT IN "
+                              "(SELECT sha256 FROM files WHERE sha256 IS NOT NULL)")
+        self.conn.commit()
+        return len(stale)
+
+    def importers(self, dll=None, symbol=None):
+        '''查询导入了指定 DLL（和/或符号）的文件，返回 (路径, dll, 符号) 列表'''
+        conditions, params = [], []
+        if dll:
+            conditions.append("i.dll = ?")
+            params.append(dll.lower())
+        if symbol:
+            conditions.append("i.symbol = ?")
+            params.append(symbol)
+        if not conditions:
+            raise ValueError("至少需要指定 dll 或 symbol")
+        return self.conn.execute(
+            "SELECT DISTINCT f.path, i.dll, i.symbol FROM imports i JOIN files f ON f.sha256 = i.sha256 "
+            f"WHERE {' AND '.join(conditions)} ORDER BY f.path", params
+        ).fetchall()
+
+    def exporters(self, symbol):
+        '''查询导出了指定符号的文件，返回 (路径, 序号) 列表'''
+        return self.conn.execute(
+            "SELECT DISTINCT f.path, e.ordinal FROM exports e JOIN files f ON f.sha256 = e.sha256 "
+            "WHERE e.symbol = ? ORDER BY f.path", (symbol,)
+        ).fetchall()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+def build_index(folder_path, index, extensions=PE_EXTENSIONS, max_workers=None, verbose=True):
+    '''
+    遍历文件夹，在进程池中分析所有 PE 文件并写入索引。
+
+    :param folder_path: 要审计的目录（例如一个 Python 环境）
+    :param index: PEImportIndex 对象
+    :param extensions: 需要分析的文件扩展名
+    :param max_workers: 进程池大小，None 表示使用 CPU 核数
+    :param verbose: 是否打印解析失败的文件
+    :return: 统计信息字典（total/skipped/parsed/errors）
+    '''
+    folder_path = os.path.abspath(folder_path)
+    stats = {'total': 0, 'skipped': 0, 'parsed': 0, 'errors': 0}
+    seen_paths = set()
+
+    def collect(result):
+        index.add(result)
+        if result['error']:
+            stats['errors'] += 1
+            if verbose:
+                print(f"解析失败: {result['path']} ({result['error']})")
+        elif result['parsed']:
+            stats['parsed'] += 1
+
+    from concurrent.futures import ProcessPoolExecutor  # 延迟导入，加快启动
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(index.known_hashes(),)) as executor:
+        submitter = BoundedSubmitter(executor, 8 * max_workers)
+        for entry in walk_files(folder_path, extensions):
+            stats['total'] += 1
+            seen_paths.add(entry.path)
+            try:
+                st = entry.stat()
+                if index.is_unchanged(entry.path, st.st_size, st.st_mtime_ns):
+                    stats['skipped'] += 1
+                    continue
+            except OSError:
+                pass
+            for result in submitter.submit(_analyze_file, entry.path):
+                collect(result)
+        for result in submitter.drain():
+            collect(result)
+
+    index.prune(folder_path, seen_paths)
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PE 文件（.pyd/.dll/.exe）导入导出分析")
+    sub = parser.add_subparsers(dest='command')
+
+    show = sub.add_parser('show', help="打印单个文件的节和导入表")
+    show.add_argument('file', nargs='?', default=pyd_file)
+
+    scan = sub.add_parser('scan', help="批量分析目录并建立索引")
+    scan.add_argument('folder')
+    scan.add_argument('--index', default='pe_index.db', help="索引数据库路径")
+    scan.add_argument('--workers', type=int, default=None, help="进程数")
+
+    query = sub.add_parser('importers', help="查询导入了指定 DLL/符号的文件")
+    query.add_argument('--dll')
+    query.add_argument('--symbol')
+    query.add_argument('--index', default='pe_index.db')
+
+    query = sub.add_parser('exporters', help="查询导出了指定符号的文件")
+    query.add_argument('symbol')
+    query.add_argument('--index', default='pe_index.db')
+
+    args = parser.parse_args(argv)
+
+    if args.command in (None, 'show'):
+        view_pyd(getattr(args, 'file', pyd_file))
+    elif args.command == 'scan':
+        with PEImportIndex(args.index) as index:
+            stats = build_index(args.folder, index, max_workers=args.workers)
+        print(f"共 {stats['total']} 个文件，跳过未变化 {stats['skipped']} 个，"
+              f"解析 {stats['parsed']} 个，失败 {stats['errors']} 个")
+    elif args.command == 'importers':
+        with PEImportIndex(args.index) as index:
+            for path, dll, symbol in index.importers(args.dll, args.symbol):
+                print(f"{path}\t{dll}\t{symbol}")
+    elif args.command == 'exporters':
+        with PEImportIndex(args.index) as index:
+            for path, ordinal in index.exporters(args.symbol):
+                print(f"{path}\t#{ordinal}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,328 @@
+import os
+import sys
+import json
+import mmap
+import hashlib
+import argparse
+import threading
+from collections import defaultdict
+
+from .common import walk_files
+
+
+class Analyzer:
+    '''
+    分析器基类。
+
+    scan_tree 每遇到一个文件，就调用各分析器的 select() 决定是否需要分析；
+    需要分析的文件交给 analyze()（workers > 0 时在该分析器自己的线程池或进程池中执行），
+    结果再通过 collect() 汇总（加锁串行调用），最后由 report() 生成报告。
+    '''
+
+    name = None         # 分析器名称，也是报告中的键
+    extensions = None   # 处理的扩展名（小写，含 .），None 表示处理所有文件
+    workers = 0         # 池大小，0 表示在遍历线程中直接执行（适合很轻量的分析）
+    executor = 'thread' # 'thread' 线程池；'process' 进程池（纯 Python 的 CPU 密集分析受 GIL 限制，线程池无法并行）
+
+    def __init__(self, workers=None):
+        if workers is not None:
+            self.workers = workers
+        self.errors = []
+
+    def select(self, path, st, extension):
+        '''返回需要分析的 (路径, stat) 列表，默认按扩展名过滤'''
+        if self.extensions is None or extension in self.extensions:
+            return [(path, st)]
+        return []
+
+    def analyze(self, path, st):
+        raise NotImplementedError
+
+    def task(self, path, st):
+        '''
+        返回提交到池中执行的 (函数, 参数元组)，默认为 (self.analyze, (path, st))。
+        进程池分析器需要覆盖：函数必须是模块级函数，参数必须可以 pickle（不能引用分析器实例）。
+        '''
+        return self.analyze, (path, st)
+
+    def collect(self, path, result):
+        raise NotImplementedError
+
+    def collect_error(self, path, error):
+        self.errors.append((path, f"{type(error).__name__}: {error}"))
+
+    def report(self):
+        raise NotImplementedError
+
+
+ANALYZERS = {}  # 已注册的分析器：名称 -> 类
+
+
+def register_analyzer(cls):
+    '''注册分析器（可用作类装饰器）'''
+    ANALYZERS[cls.name] = cls
+    return cls
+
+
+@register_analyzer
+class ExtensionStats(Analyzer):
+    '''按扩展名统计文件数量和大小'''
+
+    name = 'extensions'
+
+    def __init__(self, workers=None):
+        super().__init__(workers)
+        self.counts = defaultdict(int)
+        self.sizes = defaultdict(int)
+
+    def select(self, path, st, extension):
+        self.counts[extension or '无扩展名'] += 1
+        self.sizes[extension or '无扩展名'] += st.st_size
+        return []  # 统计在遍历时已经完成，不需要再分析文件内容
+
+    def report(self):
+        return {
+            'total_files': sum(self.counts.values()),
+            'total_size': sum(self.sizes.values()),
+            'file_types': {ext: {'count': count, 'size': self.sizes[ext]}
+                           for ext, count in sorted(self.counts.items(), key=lambda item: -item[1])},
+        }
+
+
+@register_analyzer
+class ImageIntegrity(Analyzer):
+    '''图片完整性检查（common.verify_image）'''
+
+    name = 'images'
+    extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp')
+    workers = os.cpu_count() or 1
+    executor = 'process'
+
+    def __init__(self, workers=None, level='fast'):
+        super().__init__(workers)
+        from .common import verify_image
+        self._verify_image = verify_image
+        self.level = level
+        self.total = 0
+        self.corrupted = []
+
+    def analyze(self, path, st):
+        return self._verify_image(path, self.level)
+
+    def task(self, path, st):
+        return self._verify_image, (path, self.level)
+
+    def collect(self, path, result):
+        self.total += 1
+        if not result:
+            self.corrupted.append(path)
+
+    def report(self):
+        return {'total_images': self.total, 'corrupted_count': len(self.corrupted),
+                'corrupted_paths': sorted(self.corrupted)}
+
+
+def _pe_import_table(path, size):
+    '''解析 PE 文件的导入表，返回 {dll: [符号]}（模块级函数，可在进程池中执行）'''
+    from .pe_check import parse_pe_tables
+
+    if size == 0:
+        raise ValueError("空文件")
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            _machine, imports, _exports = parse_pe_tables(data)
+    dlls = defaultdict(list)
+    for dll, symbol, _delay in imports:
+        dlls[dll].append(symbol)
+    return dict(dlls)
+
+
+@register_analyzer
+class PEImports(Analyzer):
+    '''PE 文件导入表扫描（pe_check.parse_pe_tables）'''
+
+    name = 'pe_imports'
+    extensions = ('.pyd', '.dll', '.exe')
+    workers = os.cpu_count() or 1
+    executor = 'process'
+
+    def __init__(self, workers=None):
+        super().__init__(workers)
+        self.imports = {}
+
+    def analyze(self, path, st):
+        return _pe_import_table(path, st.st_size)
+
+    def task(self, path, st):
+        return _pe_import_table, (path, st.st_size)
+
+    def collect(self, path, result):
+        self.imports[path] = result
+
+    def report(self):
+        importers = defaultdict(list)
+        for path, dlls in self.imports.items():
+            for dll in dlls:
+                importers[dll].append(path)
+        return {'total_binaries': len(self.imports),
+                'imports': self.imports,
+                'importers': {dll: sorted(paths) for dll, paths in sorted(importers.items())},
+                'errors': self.errors}
+
+
+@register_analyzer
+class DuplicateFiles(Analyzer):
+    '''
+    重复文件检测：只有出现了大小相同的另一个文件时才计算哈希，
+    大小唯一的文件不会被读取。同一文件的多个硬链接只计算一次，不算作重复。
+    '''
+
+    name = 'duplicates'
+    workers = 4  # 以磁盘读取为主，线程不宜过多
+
+    def __init__(self, workers=None, min_size=1):
+        super().__init__(workers)
+        self.min_size = min_size
+        self._first_by_size = {}            # 大小 -> 第一个该大小的文件（尚未计算哈希）
+        self._seen_files = set()            # 已遇到的 (st_dev, st_ino)
+        self.by_hash = defaultdict(list)
+
+    def select(self, path, st, extension):
+        size = st.st_size
+        if size < self.min_size:
+            return []
+        if st.st_ino:  # Windows 上 os.DirEntry.stat() 不提供 st_ino
+            identity = (st.st_dev, st.st_ino)
+            if identity in self._seen_files:
+                return []
+            self._seen_files.add(identity)
+        if size not in self._first_by_size:
+            self._first_by_size[size] = (path, st)
+            return []
+        first = self._first_by_size[size]
+        if first is None:
+            return [(path, st)]
+        self._first_by_size[size] = None    # 该大小的第一个文件随本次一起计算哈希
+        return [first, (path, st)]
+
+    def analyze(self, path, st):
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return st.st_size, digest.hexdigest()
+
+    def collect(self, path, result):
+        self.by_hash[result].append(path)
+
+    def report(self):
+        groups = [sorted(paths) for (size, _digest), paths in self.by_hash.items() if len(paths) > 1]
+        wasted = sum(size * (len(paths) - 1) for (size, _digest), paths in self.by_hash.items() if len(paths) > 1)
+        return {'duplicate_groups': sorted(groups), 'wasted_bytes': wasted, 'errors': self.errors}
+
+
+def _iter_files(folder_path, hidden=False):
+    '''遍历目录树（common.walk_files），产出 (路径, stat)；每个文件只 stat 一次，跳过文件的符号链接'''
+    for entry in walk_files(folder_path, hidden=hidden):
+        try:
+            if entry.is_symlink():  # 链接与目标是同一个文件，不重复统计和分析
+                continue
+            yield entry.path, entry.stat()
+        except OSError:
+            continue
+
+
+def scan_tree(folder_path, analyzers=None, max_pending=256, hidden=False):
+    '''
+    只遍历一次目录树，把每个文件分发给已注册的分析器。
+
+    :param folder_path: 要扫描的目录
+    :param analyzers: 分析器名称或实例的列表，None 表示使用所有已注册的分析器
+    :param max_pending: 所有分析器（线程池和进程池）共享的待处理任务上限，达到上限时遍历暂停（背压）
+    :param hidden: 是否包含隐藏文件和文件夹
+    :return: 报告字典：分析器名称 -> 该分析器的 report()
+    '''
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor  # 延迟导入，加快启动
+
+    if analyzers is None:
+        analyzers = list(ANALYZERS)
+    analyzers = [ANALYZERS[a]() if isinstance(a, str) else a for a in analyzers]
+
+    pools = {}
+    for a in analyzers:
+        if a.workers > 0 and a.executor == 'process':
+            pools[a.name] = ProcessPoolExecutor(max_workers=a.workers)
+        elif a.workers > 0:
+            pools[a.name] = ThreadPoolExecutor(max_workers=a.workers, thread_name_prefix=a.name)
+    slots = threading.BoundedSemaphore(max_pending)
+    lock = threading.Lock()
+
+    def on_done(analyzer, path):
+        def callback(future):
+            try:
+                error = future.exception()
+                with lock:
+                    if error is None:
+                        analyzer.collect(path, future.result())
+                    else:
+                        analyzer.collect_error(path, error)
+            finally:
+                slots.release()
+        return callback
+
+    try:
+        for path, st in _iter_files(folder_path, hidden):
+            extension = os.path.splitext(path)[1].lower()
+            for analyzer in analyzers:
+                for job_path, job_st in analyzer.select(path, st, extension):
+                    if analyzer.name not in pools:
+                        try:
+                            result = analyzer.analyze(job_path, job_st)
+                        except Exception as e:
+                            with lock:
+                                analyzer.collect_error(job_path, e)
+                            continue
+                        with lock:
+                            analyzer.collect(job_path, result)
+                        continue
+                    slots.acquire()  # 队列已满时阻塞遍历
+                    fn, args = analyzer.task(job_path, job_st)
+                    future = pools[analyzer.name].submit(fn, *args)
+                    future.add_done_callback(on_done(analyzer, job_path))
+    finally:
+        for pool in pools.values():
+            pool.shutdown(wait=True)
+
+    return {analyzer.name: analyzer.report() for analyzer in analyzers}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="单次遍历目录树，同时运行多个分析器")
+    parser.add_argument('folder', help="要扫描的目录")
+    parser.add_argument('--analyzers', nargs='+', choices=sorted(ANALYZERS), default=None,
+                        help="要运行的分析器，默认全部")
+    parser.add_argument('--max-pending', type=int, default=256, help="共享任务队列的上限")
+    parser.add_argument('--hidden', action='store_true', help="包含隐藏文件和文件夹")
+    parser.add_argument('--output', '-o', help="把完整报告保存为 JSON 文件")
+    args = parser.parse_args(argv)
+
+    report = scan_tree(args.folder, args.analyzers, max_pending=args.max_pending, hidden=args.hidden)
+
+    if 'extensions' in report:
+        print(f"总文件数量: {report['extensions']['total_files']}")
+    if 'images' in report:
+        print(f"图片数量: {report['images']['total_images']}，损坏: {report['images']['corrupted_count']}")
+    if 'pe_imports' in report:
+        print(f"PE 文件数量: {report['pe_imports']['total_binaries']}，"
+              f"解析失败: {len(report['pe_imports']['errors'])}")
+    if 'duplicates' in report:
+        print(f"重复文件组: {len(report['duplicates']['duplicate_groups'])}，"
+              f"浪费空间: {report['duplicates']['wasted_bytes']} 字节")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"完整报告已保存到 {args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,14 @@
-import comtypes.client
-
 def view_typelib(file_path):
     """
     此函数用于查看指定路径的.typelib文件的基本信息
     :param file_path: .typelib文件的路径
     """
+    if file_path.lower().endswith('.lib'):
+        # .lib 是 COFF 归档（导入库/静态库），不是类型库，comtypes 无法加载
+        print("该文件是 .lib 导入库，请使用 qscript-lib show 查看导出")
+        return
+    import comtypes.client  # 延迟导入，comtypes 只在 Windows 上可用
+
     try:
         # 加载Typelib文件
         typelib = comtypes.client.GetModule(file_path)
@@ -0,0 +1,71 @@
+from qscript.crawler.html_stream import extract_html, iter_response_text
+
+
+def test_implied_end_li():
+    results, _stats = extract_html(['<ul><li>a<li>b</ul>'], {'li': 'li'}, multi=['li'])
+    assert results['li'] == ['a', 'b']
+
+
+def test_implied_end_p():
+    results, _stats = extract_html(['<p>one<p>two'], {'p': 'p'}, multi=['p'])
+    assert results['p'] == ['one', 'two']
+
+
+def test_implied_end_table_cells():
+    html = '<table><tr><td>1<td>2<tr><td>3</table>'
+    results, _stats = extract_html([html], {'cells': 'td', 'rows': 'tr'}, multi=['cells', 'rows'])
+    assert results['cells'] == ['1', '2', '3']
+    assert results['rows'] == ['12', '3']
+
+
+def test_implied_end_option_and_block_closes_p():
+    html = '<select><option>x<option>y</select><p>para<div>block</div>'
+    results, _stats = extract_html([html], {'opt': 'option', 'p': 'p'}, multi=['opt'])
+    assert results['opt'] == ['x', 'y']
+    assert results['p'] == 'para'
+
+
+def test_nested_list_is_not_closed():
+    html = '<ul><li>outer<ul><li>inner</ul></ul>'
+    results, _stats = extract_html([html], {'li': 'ul > li > ul > li'})
+    assert results['li'] == 'inner'
+
+
+class _FakeResponse:
+    '''模拟 requests 的流式响应'''
+
+    def __init__(self, body, content_type, encoding):
+        self.body = body
+        self.headers = {'Content-Type': content_type}
+        self.encoding = encoding
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+def _extract_text(body, content_type, encoding, chunk_size=5):
+    response = _FakeResponse(body, content_type, encoding)
+    results, _stats = extract_html(iter_response_text(response, chunk_size), {'title': 'div.t'})
+    return results['title']
+
+
+def test_utf8_page_without_charset_header():
+    # 没有 charset 时 requests 给 text/html 的编码是 ISO-8859-1
+    body = '<div class=t>职位名称</div>'.encode('utf-8')
+    assert _extract_text(body, 'text/html', 'ISO-8859-1') == '职位名称'
+
+
+def test_meta_charset_is_used_without_header_charset():
+    body = '<html><head><meta charset="gbk"></head><div class=t>职位名称</div>'.encode('gbk')
+    assert _extract_text(body, 'text/html', 'ISO-8859-1', chunk_size=1024) == '职位名称'
+
+
+def test_header_charset_takes_precedence():
+    body = '<div class=t>café</div>'.encode('latin-1')
+    assert _extract_text(body, 'text/html; charset=ISO-8859-1', 'ISO-8859-1') == 'café'
+
+
+def test_unknown_charset_falls_back_to_utf8():
+    body = '<div class=t>职位</div>'.encode('utf-8')
+    assert _extract_text(body, 'text/html; charset=x-bogus', 'x-bogus') == '职位'
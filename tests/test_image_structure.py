@@ -0,0 +1,106 @@
+import struct
+import zlib
+
+from qscript.common import (
+    _check_bmp_structure,
+    _check_gif_structure,
+    _check_jpeg_structure,
+    _check_png_structure,
+    check_image_structure,
+)
+
+
+def _segment(marker, payload):
+    return b'\xff' + bytes([marker]) + struct.pack('>H', len(payload) + 2) + payload
+
+
+def _jpeg(scan=b'\x12\x34\xff\x00\x56' * 20, thumbnail=True):
+    '''SOI + [APP1 中带 EXIF 缩略图（含自己的 EOI）] + DQT + SOS + 扫描数据 + EOI'''
+    data = b'\xff\xd8'
+    if thumbnail:
+        thumb = b'\xff\xd8' + _segment(0xDB, b'\x00' * 65) + b'\xff\xda\x00\x08' + b'\x00' * 6 + b'\xaa' * 10 + b'\xff\xd9'
+        data += _segment(0xE1, b'Exif\x00\x00II*\x00' + b'\x00' * 4 + thumb)
+    data += _segment(0xDB, b'\x00' * 65)
+    data += _segment(0xDA, b'\x01\x01\x00\x00\x3f\x00')
+    return data + scan + b'\xff\xd9'
+
+
+def test_jpeg_complete():
+    assert _check_jpeg_structure(_jpeg()) is True
+    assert _check_jpeg_structure(_jpeg(thumbnail=False)) is True
+
+
+def test_jpeg_trailing_zero_padding():
+    assert _check_jpeg_structure(_jpeg() + b'\x00' * 16) is True
+
+
+def test_truncated_camera_jpeg_with_exif_thumbnail():
+    # 缩略图自带的 EOI 不能让截断的照片被当作完整（或交给 PIL）
+    data = _jpeg()
+    assert _check_jpeg_structure(data[:-40]) is False
+
+
+def test_jpeg_truncated_before_sos():
+    data = _jpeg()
+    assert _check_jpeg_structure(data[:30]) is False
+
+
+def test_jpeg_trailing_data_after_eoi():
+    # EOI 之后有附加数据：结构上无法判断，交给 PIL
+    assert _check_jpeg_structure(_jpeg() + b'extra trailer') is None
+
+
+def test_jpeg_bad_signature():
+    assert _check_jpeg_structure(b'\x00' + _jpeg()[1:]) is False
+
+
+def _chunk(kind, payload):
+    return struct.pack('>I', len(payload)) + kind + payload + struct.pack('>I', zlib.crc32(kind + payload))
+
+
+def _png():
+    ihdr = struct.pack('>IIBBBBB', 1, 1, 8, 0, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + _chunk(b'IHDR', ihdr) + _chunk(b'IDAT', zlib.compress(b'\x00\x00'))
+            + _chunk(b'IEND', b''))
+
+
+def test_png():
+    data = _png()
+    assert _check_png_structure(data) is True
+    assert _check_png_structure(data[:-12]) is False     # 缺少 IEND
+    assert _check_png_structure(data[:-5]) is False      # IEND 被截断
+    corrupted = bytearray(data)
+    corrupted[40] ^= 0xFF
+    assert _check_png_structure(bytes(corrupted)) is False  # CRC 不匹配
+
+
+def test_gif():
+    data = b'GIF89a' + b'\x01\x00\x01\x00\x00\x00\x00' + b',' + b'\x00' * 9 + b'\x02\x02D\x01\x00' + b';'
+    assert _check_gif_structure(data) is True
+    assert _check_gif_structure(data + b'\x00\x00') is True
+    assert _check_gif_structure(data[:-1]) is False
+    assert _check_gif_structure(b'GIF90a' + data[6:]) is False
+
+
+def test_bmp():
+    body = b'\x00' * 4 + struct.pack('<I', 26) + struct.pack('<I', 12) + b'\x00' * 12
+    data = b'BM' + struct.pack('<I', 2 + 4 + len(body)) + body
+    assert _check_bmp_structure(data) is True
+    assert _check_bmp_structure(data[:-4]) is False      # 声明的大小超过实际大小
+    assert _check_bmp_structure(b'BM' + struct.pack('<I', 0) + body) is None
+
+
+def test_check_image_structure_dispatch(tmp_path):
+    good = tmp_path / 'good.jpg'
+    good.write_bytes(_jpeg())
+    truncated = tmp_path / 'photo.JPEG'
+    truncated.write_bytes(_jpeg()[:-40])
+    empty = tmp_path / 'empty.png'
+    empty.write_bytes(b'')
+    other = tmp_path / 'notes.txt'
+    other.write_bytes(b'text')
+    assert check_image_structure(str(good)) is True
+    assert check_image_structure(str(truncated)) is False
+    assert check_image_structure(str(empty)) is False
+    assert check_image_structure(str(other)) is None
+    assert check_image_structure(str(tmp_path / 'missing.png')) is False
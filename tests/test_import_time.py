@@ -0,0 +1,28 @@
+import importlib.util
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+_spec = importlib.util.spec_from_file_location('import_time', os.path.join(ROOT, 'benchmarks', 'import_time.py'))
+import_time = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(import_time)
+
+_PROBE = '''
+import sys
+import {module}
+heavy = {heavy!r}
+print("\\n".join(sorted(name for name in sys.modules if name.split(".")[0] in heavy)))
+'''
+
+
+@pytest.mark.parametrize('module', sorted(import_time.BUDGETS_MS))
+def test_no_heavy_modules_at_import(module):
+    # 在新进程中导入，避免受测试进程中已加载模块的影响
+    proc = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, heavy=import_time.HEAVY_MODULES)],
+                          cwd=ROOT, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.split() == []
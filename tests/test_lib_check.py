@@ -0,0 +1,98 @@
+import struct
+
+import pytest
+
+from qscript.lib_check import ArchiveError, _read_lib_file, read_lib_exports
+
+_DLL = 'foo.dll'
+
+
+def _member(name, data):
+    '''COFF 归档成员：60 字节成员头 + 数据（按 2 字节对齐）'''
+    header = f'{name:<16}{0:<12}{0:<6}{0:<6}{0:<8}{len(data):<10}'.encode('ascii') + b'`\n'
+    return header + data + (b'\n' if len(data) & 1 else b'')
+
+
+def _import_member(symbol, name_type, ordinal_hint=0, machine=0x14c):
+    '''短导入头成员（导入类型为 code）'''
+    body = symbol.encode('ascii') + b'\0' + _DLL.encode('ascii') + b'\0'
+    header = struct.pack('<HHHHIIHH', 0, 0xFFFF, 0, machine, 0, len(body), ordinal_hint, name_type << 2)
+    return header + body
+
+
+def _padded(size):
+    return size + (size & 1)
+
+
+def build_import_lib(imports, second_member=True, bad_index=None):
+    '''
+    构造导入库。imports 为 (符号, NameType, 序号提示) 列表（按符号排序）。
+    second_member 为 False 时只有第一链接器成员（GNU 格式）；bad_index 替换第一个符号的成员索引。
+    '''
+    symbols = [symbol for symbol, _name_type, _hint in imports]
+    members = [_import_member(symbol, name_type, hint) for symbol, name_type, hint in imports]
+    count = len(symbols)
+    strings = b''.join(symbol.encode('ascii') + b'\0' for symbol in symbols)
+    first_size = 4 + 4 * count + len(strings)
+    second_size = 4 + 4 * count + 4 + 2 * count + len(strings)
+
+    offset = 8 + 60 + _padded(first_size)
+    if second_member:
+        offset += 60 + _padded(second_size)
+    offsets = []
+    for member in members:
+        offsets.append(offset)
+        offset += 60 + _padded(len(member))
+
+    first = struct.pack(f'>I{count}I', count, *offsets) + strings
+    data = b'!<arch>\n' + _member('/', first)
+    if second_member:
+        indices = list(range(1, count + 1))
+        if bad_index is not None:
+            indices[0] = bad_index
+        second = (struct.pack(f'<I{count}I', count, *offsets) + struct.pack(f'<I{count}H', count, *indices)
+                  + strings)
+        data += _member('/', second)
+    return data + b''.join(_member(_DLL + '/', member) for member in members)
+
+
+_IMPORTS = [
+    ('?Func@@YAXXZ', 1, 5),     # NAME：原样导出
+    ('_Ordinal', 0, 42),        # ORDINAL：按序号导入
+    ('__CorExeMain', 2, 0),     # NAME_NOPREFIX：只去掉一个前缀
+    ('_baz@8', 3, 7),           # NAME_UNDECORATE：去掉前缀并截断到 @
+]
+
+
+@pytest.mark.parametrize('second_member', [True, False])
+def test_import_lib_exports(tmp_path, second_member):
+    path = tmp_path / 'foo.lib'
+    path.write_bytes(build_import_lib(_IMPORTS, second_member=second_member))
+
+    result = read_lib_exports(str(path))
+    assert result['machine'] == 'x86'
+    assert result['objects'] == []
+    exports = {export['symbol']: export for export in result['exports']}
+    assert exports['?Func@@YAXXZ']['name'] == '?Func@@YAXXZ'
+    assert exports['?Func@@YAXXZ']['hint'] == 5
+    assert exports['_Ordinal']['ordinal'] == 42
+    assert exports['__CorExeMain']['name'] == '_CorExeMain'
+    assert exports['_baz@8']['name'] == 'baz'
+    assert {export['dll'] for export in result['exports']} == {_DLL}
+
+
+@pytest.mark.parametrize('bad_index', [0, 9])
+def test_bad_member_index(tmp_path, bad_index):
+    path = tmp_path / 'bad.lib'
+    path.write_bytes(build_import_lib(_IMPORTS, bad_index=bad_index))
+
+    with pytest.raises(ArchiveError):
+        read_lib_exports(str(path))
+    # 并行扫描中单个文件出错只记录错误，不会中断整个扫描
+    assert 'error' in _read_lib_file(str(path))
+
+
+def test_not_an_archive(tmp_path):
+    path = tmp_path / 'text.lib'
+    path.write_bytes(b'not an archive at all')
+    assert _read_lib_file(str(path))['error'].startswith('ArchiveError')